@@ -17,11 +17,12 @@ Usage::
         f.write(pptx_bytes)
 """
 
+import functools
 import io
-import math
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 from pptx import Presentation
 from pptx.chart.data import CategoryChartData
 from pptx.dml.color import RGBColor
@@ -70,19 +71,31 @@ _NA = "N/A"
 # Helpers
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=256)
 def _hex_to_rgb(hex_color: str) -> RGBColor:
-    """Convert '#RRGGBB' hex string to an RGBColor."""
+    """Convert '#RRGGBB' hex string to an RGBColor.
+
+    Memoised: a deck only uses a handful of brand colours, and RGBColor is an
+    immutable tuple, so every styled run can share the same instance.
+    """
     h = hex_color.lstrip("#")
     return RGBColor(*bytes.fromhex(h))
 
 
 def _is_missing(value: Any) -> bool:
     """Check if a value is None or NaN."""
-    if value is None:
-        return True
-    if isinstance(value, float) and math.isnan(value):
-        return True
-    return False
+    # NaN is the only float not equal to itself; avoids a math.isnan call.
+    return value is None or (isinstance(value, float) and value != value)
+
+
+def _sanitize_numeric_series(values) -> tuple[np.ndarray, np.ndarray]:
+    """Coerce a numeric series to float64 and return it with its NaN mask.
+
+    ``None`` entries become NaN, so a single vectorised ``isnan`` pass marks
+    every missing point instead of calling ``_is_missing`` per value.
+    """
+    arr = np.asarray(values, dtype=float)
+    return arr, np.isnan(arr)
 
 
 def _format_slot_value(value: Any, format_rule: FormatRule | None) -> str:
@@ -140,6 +153,16 @@ class PPTXBuilder:
         bytes
             The rendered .pptx file content.
         """
+        buf = io.BytesIO()
+        self.build_presentation_object(payload).save(buf)
+        return buf.getvalue()
+
+    def build_presentation_object(self, payload: dict[str, Any]) -> Presentation:
+        """Build the PPTX and return the in-memory Presentation.
+
+        Same rendering as ``build`` but skips serialisation, so callers that
+        only inspect the result avoid a save/re-parse round-trip.
+        """
         prs = Presentation()
         prs.slide_width = Inches(self.schema.width_inches)
         prs.slide_height = Inches(self.schema.height_inches)
@@ -147,14 +170,15 @@ class PPTXBuilder:
         for slide_schema in self.schema.slides:
             self._build_slide(prs, slide_schema, payload)
 
-        buf = io.BytesIO()
-        prs.save(buf)
-        return buf.getvalue()
+        return prs
 
     def build_to_file(self, payload: dict[str, Any], path: str | Path) -> None:
-        """Build the PPTX and write it to a file path."""
-        data = self.build(payload)
-        Path(path).write_bytes(data)
+        """Build the PPTX and write it to a file path.
+
+        Saves straight to the file rather than going through ``build`` and an
+        intermediate bytes copy of the whole deck.
+        """
+        self.build_presentation_object(payload).save(str(path))
 
     # ------------------------------------------------------------------
     # Slide builders
@@ -414,7 +438,16 @@ class PPTXBuilder:
                     series_values = [0] * len(categories)
                 else:
                     continue
-            chart_data.add_series(s.name, tuple(series_values))
+            try:
+                arr, missing = _sanitize_numeric_series(series_values)
+            except (TypeError, ValueError):
+                chart_data.add_series(s.name, tuple(series_values))
+                continue
+            # Missing points become blanks; python-pptx would write NaN as
+            # the literal "nan", which PowerPoint rejects.
+            points = arr.astype(object)
+            points[missing] = None
+            chart_data.add_series(s.name, tuple(points))
 
         pos = slot.position
         chart_frame = slide.shapes.add_chart(
@@ -11,6 +11,8 @@ Handles reading, cleaning, and normalizing data from multiple source types:
 - Historical Comparison (CSV, UTF-16 LE, tab-delimited)
 """
 
+import functools
+import os
 import re
 from pathlib import Path
 
@@ -21,6 +23,12 @@ import pandas as pd
 # Value parsers
 # ---------------------------------------------------------------------------
 
+# Compiled once: the parsers run per cell on every ingested column.
+_THOUSANDS_SEP = str.maketrans("", "", ",")
+_ARROWS = str.maketrans("", "", "↑↓")
+_PCT_RE = re.compile(r"^([+-]?\d+\.?\d*)\s*(?:%|ppts?)$", re.IGNORECASE)
+
+
 def parse_numeric(value):
     """Parse a numeric value that may contain commas or float artifacts.
 
@@ -31,18 +39,17 @@ def parse_numeric(value):
         42 -> 42.0
         NaN -> NaN
     """
-    if pd.isna(value):
-        return float("nan")
     if isinstance(value, (int, float)):
-        return float(value)
-    s = str(value).strip().replace(",", "")
+        return float(value)  # NaN passes through as NaN
+    if not isinstance(value, str):
+        if value is None or pd.isna(value):
+            return float("nan")
+        value = str(value)
+    s = value.translate(_THOUSANDS_SEP).strip()
     if not s:
         return float("nan")
     try:
-        f = float(s)
-        if f == int(f) and "." not in str(value).replace(",", "").rstrip("0"):
-            return float(int(f))
-        return f
+        return float(s)
     except ValueError:
         return float("nan")
 
@@ -59,26 +66,16 @@ def parse_percentage(value):
 
     Returns NaN for unparseable values.
     """
-    if pd.isna(value):
-        return float("nan")
     if isinstance(value, (int, float)):
-        return float(value)
-    s = str(value).strip()
-    # Strip unicode arrows
-    s = re.sub(r"[↑↓]", "", s).strip()
-    if not s:
-        return float("nan")
-
-    # Handle "ppts" format: "-3.52 ppts" -> -0.0352
-    ppts_match = re.match(r"^([+-]?\d+\.?\d*)\s*ppts?$", s, re.IGNORECASE)
-    if ppts_match:
-        return float(ppts_match.group(1)) / 100
-
-    # Handle percentage: "170.6%" -> 1.706, "-21.6%" -> -0.216
-    pct_match = re.match(r"^([+-]?\d+\.?\d*)\s*%$", s)
-    if pct_match:
-        return float(pct_match.group(1)) / 100
-
+        return float(value)  # NaN passes through as NaN
+    if not isinstance(value, str):
+        if value is None or pd.isna(value):
+            return float("nan")
+        value = str(value)
+    # Both "%" and "ppts" values are scaled by 1/100
+    match = _PCT_RE.match(value.translate(_ARROWS).strip())
+    if match:
+        return float(match.group(1)) / 100
     return float("nan")
 
 
@@ -88,7 +85,11 @@ def parse_percentage(value):
 
 def clean_columns(df):
     """Strip whitespace from column names and deduplicate."""
-    df.columns = [c.strip() if isinstance(c, str) else c for c in df.columns]
+    if df.columns.inferred_type == "string":
+        df.columns = df.columns.str.strip()
+    else:
+        # Mixed/non-string labels (e.g. Excel year headers): strip only strings
+        df.columns = [c.strip() if isinstance(c, str) else c for c in df.columns]
     return df
 
 
@@ -96,22 +97,54 @@ def clean_columns(df):
 # Encoding detection and CSV reading
 # ---------------------------------------------------------------------------
 
+# Byte-order marks -> (encoding, delimiter). Longest first, so a UTF-32 LE
+# BOM is not mistaken for UTF-16 LE. Unicode exports are tab-delimited.
+_BOMS = (
+    (b"\xff\xfe\x00\x00", "utf-32", "\t"),
+    (b"\x00\x00\xfe\xff", "utf-32", "\t"),
+    (b"\xef\xbb\xbf", "utf-8-sig", ","),
+    (b"\xff\xfe", "utf-16-le", "\t"),
+    (b"\xfe\xff", "utf-16-be", "\t"),
+)
+
+
 def detect_encoding(path):
-    """Detect whether a file is UTF-16 LE (with BOM) or UTF-8.
+    """Detect a file's encoding from its byte-order mark.
+
+    UTF-16/32 exports are tab-delimited; files without a BOM are read
+    as comma-delimited UTF-8. Results are cached per (path, mtime, size),
+    so re-ingesting an unchanged file skips the read.
 
     Returns (encoding, delimiter) tuple.
     """
+    st = os.stat(path)
+    return _detect_encoding_cached(
+        str(Path(path).resolve()), st.st_mtime_ns, st.st_size
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _detect_encoding_cached(path, mtime_ns, size):
     with open(path, "rb") as f:
-        raw = f.read(4)
-    if raw[:2] == b"\xff\xfe":
-        return "utf-16-le", "\t"
+        head = f.read(4)
+    for bom, encoding, sep in _BOMS:
+        if head.startswith(bom):
+            return encoding, sep
     return "utf-8", ","
 
 
-def read_csv_auto(path):
-    """Read a CSV file with automatic encoding and delimiter detection."""
+def read_csv_auto(path, **read_kwargs):
+    """Read a CSV file with automatic encoding and delimiter detection.
+
+    Extra keyword arguments (e.g. ``thousands``) are passed to pd.read_csv.
+    """
     encoding, sep = detect_encoding(path)
-    df = pd.read_csv(path, encoding=encoding, sep=sep)
+    # Single-pass C tokenizer: the separator is already known, and
+    # low_memory=False avoids chunked, mixed-dtype column inference.
+    df = pd.read_csv(
+        path, encoding=encoding, sep=sep, engine="c", low_memory=False,
+        **read_kwargs,
+    )
     return clean_columns(df)
 
 
@@ -119,21 +152,48 @@ def read_csv_auto(path):
 # Numeric column cleaning
 # ---------------------------------------------------------------------------
 
+def _parse_column(series, parse_text):
+    """Vectorised counterpart of the scalar parsers for one column.
+
+    Numbers pass through as floats and other non-strings become NaN,
+    matching parse_numeric / parse_percentage; string cells are handed
+    to *parse_text* as a single Series.
+    """
+    if pd.api.types.is_numeric_dtype(series):
+        return series.astype(float)
+    is_text = series.map(type).eq(str)
+    result = pd.to_numeric(series.where(~is_text), errors="coerce").astype(float)
+    if is_text.any():
+        result[is_text] = parse_text(series[is_text].astype(str))
+    return result
+
+
+def _numeric_text(text):
+    return pd.to_numeric(
+        text.str.translate(_THOUSANDS_SEP).str.strip(), errors="coerce"
+    )
+
+
+def _percentage_text(text):
+    number = text.str.translate(_ARROWS).str.strip().str.extract(_PCT_RE, expand=False)
+    return pd.to_numeric(number, errors="coerce") / 100
+
+
 def clean_numeric_columns(df, columns=None):
-    """Apply parse_numeric to specified columns (or all object columns)."""
+    """Parse specified columns (or all object columns) as numbers."""
     if columns is None:
         columns = df.select_dtypes(include=["object", "string"]).columns.tolist()
     for col in columns:
         if col in df.columns:
-            df[col] = df[col].apply(parse_numeric)
+            df[col] = _parse_column(df[col], _numeric_text)
     return df
 
 
 def clean_percentage_columns(df, columns):
-    """Apply parse_percentage to specified columns."""
+    """Parse specified columns as percentages (see parse_percentage)."""
     for col in columns:
         if col in df.columns:
-            df[col] = df[col].apply(parse_percentage)
+            df[col] = _parse_column(df[col], _percentage_text)
     return df
 
 
@@ -141,6 +201,27 @@ def clean_percentage_columns(df, columns):
 # Source-specific ingestors
 # ---------------------------------------------------------------------------
 
+# Known header typos in the exports, fixed wherever they occur in a label
+_CRM_TYPOS = {"Unsibscribe": "Unsubscribe"}
+_AFFILIATE_TYPOS = {"Sale-Actvie": "Sale-Active"}
+
+
+def _fix_header_typos(df, typos):
+    """Apply every typo fix in *typos* with a single rename."""
+    rename_map = {}
+    for col in df.columns:
+        if not isinstance(col, str):
+            continue
+        fixed = col
+        for typo, correct in typos.items():
+            fixed = fixed.replace(typo, correct)
+        if fixed != col:
+            rename_map[col] = fixed
+    if rename_map:
+        df = df.rename(columns=rename_map)
+    return df
+
+
 def ingest_tracker(path):
     """Ingest Internal Performance Tracker (.xlsx).
 
@@ -187,7 +268,7 @@ def ingest_product_sales(path):
     Cleans column names, parses numeric and percentage columns.
     Returns a single DataFrame with cleaned types.
     """
-    df = read_csv_auto(path)
+    df = read_csv_auto(path, thousands=",")
 
     # Identify column groups
     dimension_cols = [c for c in df.columns if c.startswith("Dimension")]
@@ -195,7 +276,8 @@ def ingest_product_sales(path):
     comparison_cols = [c for c in df.columns if "(Comparison)" in c]
     vs_comp_cols = [c for c in df.columns if "(vs. Comp)" in c]
 
-    # Parse numeric analysis/comparison columns (comma-formatted strings)
+    # Comma-formatted numbers are parsed by read_csv (thousands=","); this
+    # mops up any analysis/comparison column that still holds text
     clean_numeric_columns(df, analysis_cols + comparison_cols)
 
     # Parse percentage variance columns
@@ -209,7 +291,7 @@ def ingest_offer_performance(path):
 
     Cleans column names, parses numeric and percentage columns.
     """
-    df = read_csv_auto(path)
+    df = read_csv_auto(path, thousands=",")
 
     numeric_cols = ["Redemptions", "Revenue", "Discount Amount"]
     pct_cols = ["% Change Redemptions", "% Change Revenue", "% Change Discount Amount"]
@@ -226,18 +308,12 @@ def ingest_crm(path, sheet_name="Custom Dates Dimension Table"):
     Reads the specified sheet and normalizes column names.
     Handles the known typo 'Unsibscribe Rate' -> 'Unsubscribe Rate'.
     """
-    df = pd.read_excel(path, sheet_name=sheet_name, engine="openpyxl")
+    df = pd.read_excel(
+        path, sheet_name=sheet_name, engine="openpyxl",
+        engine_kwargs={"read_only": True},
+    )
     df = clean_columns(df)
-
-    # Fix known typos
-    rename_map = {}
-    for col in df.columns:
-        if "Unsibscribe" in col:
-            rename_map[col] = col.replace("Unsibscribe", "Unsubscribe")
-    if rename_map:
-        df = df.rename(columns=rename_map)
-
-    return df
+    return _fix_header_typos(df, _CRM_TYPOS)
 
 
 def ingest_affiliate(path, sheet_name="Table - Custom Dates"):
@@ -246,18 +322,12 @@ def ingest_affiliate(path, sheet_name="Table - Custom Dates"):
     Reads the specified sheet, normalizes column names, and fixes
     known typos.
     """
-    df = pd.read_excel(path, sheet_name=sheet_name, engine="openpyxl")
+    df = pd.read_excel(
+        path, sheet_name=sheet_name, engine="openpyxl",
+        engine_kwargs={"read_only": True},
+    )
     df = clean_columns(df)
-
-    # Fix known typos
-    rename_map = {}
-    for col in df.columns:
-        if "Sale-Actvie" in col:
-            rename_map[col] = col.replace("Sale-Actvie", "Sale-Active")
-    if rename_map:
-        df = df.rename(columns=rename_map)
-
-    return df
+    return _fix_header_typos(df, _AFFILIATE_TYPOS)
 
 
 def ingest_targets(path):
@@ -286,7 +356,7 @@ def ingest_historical(path):
 
     Prior-year daily data for YoY calculations.
     """
-    df = read_csv_auto(path)
+    df = read_csv_auto(path, thousands=",")
 
     numeric_cols = ["Orders", "New Customers", "Cost", "Revenue"]
     pct_cols = ["CoS", "Phased", "Phased.1"]
@@ -327,9 +397,11 @@ def ingest(path, source_type):
     Raises:
         ValueError: If source_type is not recognized.
     """
-    if source_type not in SOURCE_TYPES:
+    try:
+        ingestor = SOURCE_TYPES[source_type]
+    except KeyError:
         raise ValueError(
             f"Unknown source type '{source_type}'. "
             f"Valid types: {', '.join(sorted(SOURCE_TYPES))}"
-        )
-    return SOURCE_TYPES[source_type](path)
+        ) from None
+    return ingestor(path)
@@ -71,6 +71,15 @@ class QAResult:
     def warnings(self) -> list[Issue]:
         return [i for i in self.issues if i.severity == "warning"]
 
+    @property
+    def errors_by_category(self) -> dict[str, list[Issue]]:
+        """Errors grouped by category, in one pass over the issues."""
+        grouped: dict[str, list[Issue]] = {}
+        for issue in self.issues:
+            if issue.severity == "error":
+                grouped.setdefault(issue.category, []).append(issue)
+        return grouped
+
     @property
     def passed(self) -> bool:
         return len(self.errors) == 0
@@ -189,6 +198,24 @@ class QAValidator:
         self._check_payload_types(payload, result)
         return result
 
+    def validate_divider_backgrounds(self, pptx_bytes: bytes) -> QAResult:
+        """Check only the section divider background fills.
+
+        A focused subset of ``validate``: the slide count is checked, then
+        only the divider slides are inspected; slots are not.
+        """
+        prs = Presentation(io.BytesIO(pptx_bytes))
+        result = QAResult()
+
+        self._check_slide_count(prs, result)
+        if len(prs.slides) == len(self.schema.slides):
+            for slide_schema in self.schema.slides:
+                if slide_schema.slide_type == SlideType.SECTION_DIVIDER:
+                    slide = prs.slides[slide_schema.index]
+                    self._check_divider_background(slide, slide_schema, result)
+
+        return result
+
     # ------------------------------------------------------------------
     # Presentation-level checks
     # ------------------------------------------------------------------
@@ -107,20 +107,23 @@ def format_integer(value: float | int | None) -> str:
     return f"{int(value):,}"
 
 
+# Built once at import: format_value runs for every KPI, table cell and label.
+_FORMATTERS = {
+    FormatType.CURRENCY: format_currency,
+    FormatType.PERCENTAGE: format_percentage,
+    FormatType.VARIANCE_PERCENTAGE: format_variance_percentage,
+    FormatType.POINTS_CHANGE: format_points_change,
+    FormatType.NUMBER: format_number,
+    FormatType.INTEGER: format_integer,
+    FormatType.TEXT: lambda v: str(v) if v is not None else "N/A",
+}
+
+
 def format_value(value: float | int | str | None, format_type: FormatType) -> str:
     """Format a value according to its FormatType."""
     if isinstance(value, str):
         return value
-    formatters = {
-        FormatType.CURRENCY: format_currency,
-        FormatType.PERCENTAGE: format_percentage,
-        FormatType.VARIANCE_PERCENTAGE: format_variance_percentage,
-        FormatType.POINTS_CHANGE: format_points_change,
-        FormatType.NUMBER: format_number,
-        FormatType.INTEGER: format_integer,
-        FormatType.TEXT: lambda v: str(v) if v is not None else "N/A",
-    }
-    formatter = formatters.get(format_type, str)
+    formatter = _FORMATTERS.get(format_type, str)
     return formatter(value)
 
 
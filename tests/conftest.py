@@ -0,0 +1,33 @@
+"""Shared pytest fixtures.
+
+Schema fixtures here are session-scoped: the schema objects are treated as
+read-only by the builder, mapper and validator, so one instance is shared
+across every test module instead of being rebuilt per test. Under
+pytest-xdist (``pytest -n auto --dist=loadgroup``) each worker builds its own
+copy once.
+"""
+
+import pytest
+
+from src.schema.models import DesignSystem
+from src.schema.monthly_report import build_monthly_report_schema
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "slow: builds a full-size deck (deselect with -m 'not slow')",
+    )
+    config.addinivalue_line(
+        "markers", "performance: wall-clock budget checks for the build path",
+    )
+
+
+@pytest.fixture(scope="session")
+def design():
+    return DesignSystem()
+
+
+@pytest.fixture(scope="session")
+def full_schema():
+    """The full 14-slide monthly report schema."""
+    return build_monthly_report_schema()
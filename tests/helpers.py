@@ -0,0 +1,249 @@
+"""Synthetic CoWork data factories and payload/deck helpers shared by tests.
+
+The factories return fresh objects on every call; tests that want to share
+built data do so through session-scoped fixtures.
+"""
+
+import calendar
+import io
+import math
+import zipfile
+
+import numpy as np
+import pandas as pd
+
+from src.processor.mapper import REPORT_CHANNELS
+
+
+# ---------------------------------------------------------------------------
+# Synthetic CoWork data factories
+# ---------------------------------------------------------------------------
+
+def make_raw_data_multi(periods, days=None, channels=None):
+    """Build a synthetic RAW DATA DataFrame matching CoWork tracker schema.
+
+    Covers every ``(year, month)`` in ``periods`` in a single frame; each
+    channel gets one row per day with deterministic values.
+    """
+    if channels is None:
+        channels = REPORT_CHANNELS
+    if days is None:
+        days = list(range(1, 29))  # 28 days default
+
+    # One row per (period, day, channel), built column-wise; scalars broadcast
+    years, months = zip(*periods)
+    per_period = len(days) * len(channels)
+    day_col = np.repeat(np.asarray(days, dtype=np.int64), len(channels))
+    channel_col = np.tile(np.asarray(channels, dtype=object), len(days))
+    return pd.DataFrame({
+        "COS Year": np.repeat(np.asarray(years, dtype=np.int64), per_period),
+        "COS Month": np.repeat(np.asarray(months, dtype=np.int64), per_period),
+        "COS Day": np.tile(day_col, len(periods)),
+        "COS Channel": np.tile(channel_col, len(periods)),
+        "COS Locale": "en_US",
+        "COS Orders": 10,
+        "COS New Customers": 5,
+        "COS COS%": 0.10,
+        "COS CAC": 20.0,
+        "COS CPA": 10.0,
+        "COS Cost": 100.0,
+        "COS Revenue": 1000.0,
+        "COS Sessions": 200,
+        "COS AOV": 100.0,
+        "COS Conversion": 0.05,
+    })
+
+
+def make_targets(year, month, channels=None):
+    """Build a synthetic Targets DataFrame matching CoWork target schema."""
+    if channels is None:
+        channels = REPORT_CHANNELS
+    num_days = calendar.monthrange(year, month)[1]
+    dates = pd.date_range(pd.Timestamp(year, month, 1), periods=num_days, freq="D")
+
+    return pd.DataFrame({
+        "Target_Type_Id": "Daily",
+        "Date": dates.repeat(len(channels)),
+        "Site_Id": "No 7",
+        "Locale_Id": "en_US",
+        "Channel_Id": np.tile(np.asarray(channels, dtype=object), num_days),
+        "Notes": float("nan"),
+        "Gross_Revenue_Target": 900.0,
+        "Net_Revenue_Target": 850.0,
+        "Marketing_Spend_Target": 90.0,
+        "Session_Target": 180,
+        "Order_Target": 9,
+        "New_Customer_Target": 4,
+    })
+
+
+def make_tracker(year, month, ly_year=None, ly_month=None):
+    """Build tracker dict with RAW DATA for current + prior year."""
+    if ly_year is None:
+        ly_year = year - 1
+    if ly_month is None:
+        ly_month = month
+    raw = make_raw_data_multi([(year, month), (ly_year, ly_month)])
+    return {"RAW DATA": raw}
+
+
+def make_offer_performance(month):
+    """Build synthetic offer performance DataFrame (CoWork promo format)."""
+    promos = ["Promo A", "Promo B", "Promo C"]
+    channels = ["AFFILIATE", "EMAIL", "PPC"]
+    n = len(promos) * len(channels)
+    # promo × channel rows followed by the Grand Total row
+    return pd.DataFrame({
+        "Dimension 1": [p for p in promos for _ in channels] + ["Grand Total"],
+        "Dimension 2": channels * len(promos) + ["Total"],
+        "Dimension 3": [str(month)] * n + ["Total"],
+        "Dimension 4": "Total",
+        "Redemptions": [1000.0] * n + [9000.0],
+        "% Change Redemptions": -0.10,
+        "Revenue": [50000.0] * n + [450000.0],
+        "% Change Revenue": 0.15,
+        "Discount Amount": [5000.0] * n + [45000.0],
+        "% Change Discount Amount": -0.05,
+    })
+
+
+def make_product_sales(month):
+    """Build synthetic product sales DataFrame (CoWork product format)."""
+    products = ["Product X", "Product Y", "Product Z"]
+    n = len(products)
+    # One row per product followed by the Grand Total row
+    return pd.DataFrame({
+        "Dimension 1": products + ["Grand Total"],
+        "Dimension 2": [str(month)] * n + ["Total"],
+        "Dimension 3": "Total",
+        "Units (Analysis)": [500.0] * n + [1500.0],
+        "Units (Comparison)": [400.0] * n + [1200.0],
+        "Units (vs. Comp)": 0.25,
+        "Total Revenue (Analysis)": [25000.0] * n + [75000.0],
+        "Total Revenue (Comparison)": [20000.0] * n + [60000.0],
+        "Total Revenue (vs. Comp)": 0.25,
+        "AOV (Analysis)": 50.0,
+        "Avg. Selling Price (Analysis)": 45.0,
+        "Total Discount % (Analysis)": 0.10,
+        "New Customers (Analysis)": [100.0] * n + [300.0],
+    })
+
+
+def make_crm():
+    """Build synthetic CRM performance DataFrame (CoWork email format)."""
+    return pd.DataFrame([
+        {
+            "Col A": "Grand Total", "Col B": "Total", "Col C": "Total",
+            "Emails Sent": 50000, "Emails Sent vs Comp": -0.05,
+            "Open Rate": 0.25, "Open Rate vs Comp": 0.02,
+            "Click-Through Rate": 0.08, "Click-Through Rate vs Comp": -0.01,
+            "Sessions": 10000, "Sessions vs Comp": 0.10,
+            "Orders": 500, "Orders vs Comp": 0.20,
+            "CVR": 0.05, "CVR vs Comp": 0.005,
+            "Revenue": 75000.0, "Revenue vs Comp": 0.15,
+            "AOV": 150.0, "AOV vs Comp": -0.03,
+        },
+        {
+            "Col A": "Grand Total", "Col B": "Total", "Col C": "Manual",
+            "Emails Sent": 30000, "Emails Sent vs Comp": -0.03,
+            "Open Rate": 0.22, "Open Rate vs Comp": 0.01,
+            "Click-Through Rate": 0.07, "Click-Through Rate vs Comp": -0.005,
+            "Sessions": 6000, "Sessions vs Comp": 0.08,
+            "Orders": 300, "Orders vs Comp": 0.18,
+            "CVR": 0.05, "CVR vs Comp": 0.004,
+            "Revenue": 45000.0, "Revenue vs Comp": 0.12,
+            "AOV": 150.0, "AOV vs Comp": -0.02,
+        },
+        {
+            "Col A": "Grand Total", "Col B": "Total", "Col C": "Automated",
+            "Emails Sent": 20000, "Emails Sent vs Comp": -0.08,
+            "Open Rate": 0.30, "Open Rate vs Comp": 0.03,
+            "Click-Through Rate": 0.10, "Click-Through Rate vs Comp": -0.02,
+            "Sessions": 4000, "Sessions vs Comp": 0.12,
+            "Orders": 200, "Orders vs Comp": 0.22,
+            "CVR": 0.05, "CVR vs Comp": 0.006,
+            "Revenue": 30000.0, "Revenue vs Comp": 0.20,
+            "AOV": 150.0, "AOV vs Comp": -0.05,
+        },
+    ])
+
+
+def make_affiliate():
+    """Build synthetic affiliate publisher DataFrame (CoWork affiliate format)."""
+    names = ["Publisher A", "Publisher B", "Publisher C"]
+    i = np.arange(len(names))
+    # Grand Total row followed by one row per publisher
+    return pd.DataFrame({
+        "Dimension 1": ["Grand Total"] + [str(1000 + k) for k in i],
+        "Dimension 2": ["All Publishers"] + names,
+        "Dimension 3": "Total",
+        "Influencer Filter": ["Total"] + ["Affiliate"] * len(names),
+        "Revenue (Analysis)": np.r_[100000.0, 30000.0 - i * 5000],
+        "Revenue (Comparison)": np.r_[80000.0, 25000.0 - i * 5000],
+        "Revenue (vs Comp)": np.r_[0.25, np.full(len(names), 0.20)],
+        "Cost (Analysis)": np.r_[10000.0, 3000.0 - i * 500],
+        "Cost (Comparison)": np.r_[9000.0, 2500.0 - i * 500],
+        "Cost (vs Comp)": np.r_[0.111, np.full(len(names), 0.20)],
+        "CoS (Analysis)": 0.10,
+        "CoS (vs Comp)": np.r_[-0.01, np.full(len(names), -0.005)],
+        "Orders (Analysis)": np.r_[1000, 300 - i * 50],
+        "Orders (vs Comp)": np.r_[0.20, np.full(len(names), 0.15)],
+        "CVR (Analysis)": 0.05,
+        "CVR (vs Comp)": np.r_[0.005, np.full(len(names), 0.003)],
+        "Sessions (Analysis)": np.r_[20000, 6000 - i * 1000],
+        "AOV (Analysis)": 100.0,
+        "Total Commission (Analysis)": np.r_[8000.0, 2500.0 - i * 400],
+    })
+
+
+def all_sources(year, month):
+    """Build a complete set of CoWork data sources for a given month."""
+    return {
+        "tracker": make_tracker(year, month),
+        "targets": make_targets(year, month),
+        "offer_performance": make_offer_performance(month),
+        "product_sales": make_product_sales(month),
+        "crm": make_crm(),
+        "affiliate": make_affiliate(),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Payload and deck helpers
+# ---------------------------------------------------------------------------
+
+def payload_floats(payload):
+    """Yield ``(path, value)`` for every float in a payload.
+
+    Covers top-level values, list items and the fields of list-of-dict rows.
+    """
+    for key, val in payload.items():
+        if isinstance(val, float):
+            yield key, val
+        elif isinstance(val, list):
+            for i, item in enumerate(val):
+                if isinstance(item, float):
+                    yield f"{key}[{i}]", item
+                elif isinstance(item, dict):
+                    for k, v in item.items():
+                        if isinstance(v, float):
+                            yield f"{key}[{i}].{k}", v
+
+
+def assert_payload_finite(payload):
+    """Assert no float anywhere in a payload is NaN or infinite."""
+    bad = [path for path, v in payload_floats(payload) if not math.isfinite(v)]
+    assert not bad, f"non-finite payload values at {bad}"
+
+
+def xml_part_crcs(pptx_bytes: bytes) -> dict[str, int]:
+    """CRC-32 of every XML part, read from the zip directory (no inflating).
+
+    Embedded chart workbooks carry their own write timestamps, so only the
+    XML parts are byte-stable between two builds of the same payload.
+    """
+    with zipfile.ZipFile(io.BytesIO(pptx_bytes)) as z:
+        return {
+            info.filename: info.CRC for info in z.infolist()
+            if info.filename.endswith((".xml", ".rels"))
+        }
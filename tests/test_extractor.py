@@ -36,6 +36,21 @@ def monthly_analysis(analysis_data):
     pytest.skip("monthly-report-template.pptx analysis not found")
 
 
+@pytest.fixture
+def qbr_analysis(request):
+    """Return only the QBR template analysis.
+
+    ``analysis_data`` is requested lazily so the existence check runs before
+    the JSON is loaded, skipping rather than erroring when it is missing.
+    """
+    if not ANALYSIS_PATH.exists():
+        pytest.skip("template_analysis.json not found")
+    for t in request.getfixturevalue("analysis_data"):
+        if "qbr" in t["source_file"].lower():
+            return t
+    pytest.skip("qbr-template.pptx analysis not found")
+
+
 @pytest.fixture
 def monthly_schema(monthly_analysis):
     """Extract the monthly report schema."""
@@ -310,12 +325,9 @@ class TestSchemaMetadata:
         assert "{month}" in monthly_schema.naming_convention
         assert "{year}" in monthly_schema.naming_convention
 
-    def test_qbr_report_type(self, analysis_data):
-        for t in analysis_data:
-            if "qbr" in t["source_file"].lower():
-                schema = extract_template(t)
-                assert schema.report_type == "qbr"
-                break
+    def test_qbr_report_type(self, qbr_analysis):
+        schema = extract_template(qbr_analysis)
+        assert schema.report_type == "qbr"
 
 
 # ---------------------------------------------------------------------------
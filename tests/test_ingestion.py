@@ -130,6 +130,11 @@ class TestCleanColumns:
         df = clean_columns(df)
         assert list(df.columns) == ["a", "b"]
 
+    def test_non_string_labels_kept(self):
+        df = pd.DataFrame({" a ": [1], 2024: [2]})
+        df = clean_columns(df)
+        assert list(df.columns) == ["a", 2024]
+
 
 # ---------------------------------------------------------------------------
 # detect_encoding
@@ -151,6 +156,24 @@ class TestDetectEncoding:
         assert enc == "utf-8"
         assert sep == ","
 
+    @pytest.mark.parametrize("bom, text_encoding, expected", [
+        (b"\xef\xbb\xbf", "utf-8", ("utf-8-sig", ",")),
+        (b"\xfe\xff", "utf-16-be", ("utf-16-be", "\t")),
+        (b"\xff\xfe\x00\x00", "utf-32-le", ("utf-32", "\t")),
+        (b"\x00\x00\xfe\xff", "utf-32-be", ("utf-32", "\t")),
+    ])
+    def test_other_boms(self, tmp_path, bom, text_encoding, expected):
+        p = tmp_path / "test.csv"
+        p.write_bytes(bom + "col1\tcol2\n".encode(text_encoding))
+        assert detect_encoding(p) == expected
+
+    def test_rewritten_file_redetected(self, tmp_path):
+        p = tmp_path / "test.csv"
+        p.write_text("col1,col2\n1,2\n", encoding="utf-8")
+        assert detect_encoding(p) == ("utf-8", ",")
+        p.write_bytes(b"\xff\xfe" + "col1\tcol2\n1\t2\n".encode("utf-16-le"))
+        assert detect_encoding(p) == ("utf-16-le", "\t")
+
 
 # ---------------------------------------------------------------------------
 # read_csv_auto
@@ -311,30 +334,47 @@ class TestIngestDispatcher:
 # CRM typo handling
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(scope="class")
+def crm_xlsx(tmp_path_factory):
+    p = tmp_path_factory.mktemp("crm") / "crm.xlsx"
+    pd.DataFrame({
+        "Emails Sent": [1000],
+        "Unsibscribe Rate": [0.02],
+    }).to_excel(p, index=False, engine="openpyxl")
+    return p
+
+
+def _stub_read_excel(monkeypatch, df):
+    """Have ingestion's pd.read_excel return *df* without touching disk."""
+    monkeypatch.setattr(
+        "src.processor.ingestion.pd.read_excel", lambda *a, **k: df.copy()
+    )
+
+
 class TestCrmTypoHandling:
-    def test_unsibscribe_renamed(self, tmp_path):
-        p = tmp_path / "crm.xlsx"
-        df = pd.DataFrame({
+    def test_unsibscribe_renamed(self, monkeypatch):
+        _stub_read_excel(monkeypatch, pd.DataFrame({
             "Emails Sent": [1000],
             "Unsibscribe Rate": [0.02],
-        })
-        df.to_excel(p, index=False, engine="openpyxl")
-        result = ingest_crm(p, sheet_name="Sheet1")
+        }))
+        result = ingest_crm("ignored.xlsm", sheet_name="Sheet1")
         assert "Unsubscribe Rate" in result.columns
         assert "Unsibscribe Rate" not in result.columns
 
+    def test_reads_workbook(self, crm_xlsx):
+        result = ingest_crm(crm_xlsx, sheet_name="Sheet1")
+        assert result["Unsubscribe Rate"].iloc[0] == pytest.approx(0.02)
+
 
 # ---------------------------------------------------------------------------
 # Affiliate typo handling
 # ---------------------------------------------------------------------------
 
 class TestAffiliateTypoHandling:
-    def test_sale_actvie_renamed(self, tmp_path):
-        p = tmp_path / "affiliate.xlsx"
-        df = pd.DataFrame({
+    def test_sale_actvie_renamed(self, monkeypatch):
+        _stub_read_excel(monkeypatch, pd.DataFrame({
             "Dimension 1": [1004849],
             "Sale-Actvie Publishers (CountD) (Analysis)": [5],
-        })
-        df.to_excel(p, index=False, engine="openpyxl")
-        result = ingest_affiliate(p, sheet_name="Sheet1")
+        }))
+        result = ingest_affiliate("ignored.xlsm", sheet_name="Sheet1")
         assert "Sale-Active Publishers (CountD) (Analysis)" in result.columns
@@ -8,271 +8,56 @@ structure, runs it through the complete pipeline, and validates that the
 output PPTX is structurally correct and data-accurate.
 """
 
-import calendar
 import io
-import math
 
-import pandas as pd
 import pytest
 from pptx import Presentation
 from pptx.dml.color import RGBColor
 from pptx.util import Inches
 
 from src.generator.pptx_builder import PPTXBuilder
-from src.processor.mapper import (
-    DataMapper,
-    MappingResult,
-    REPORT_CHANNELS,
-)
+from src.processor.mapper import DataMapper, MappingResult
 from src.qa.validator import QAValidator, QAResult
 from src.schema.models import SlotType, SlideType
 from src.schema.monthly_report import build_monthly_report_schema
 from src.schema.qbr_report import build_qbr_schema
+from tests.helpers import (
+    all_sources,
+    assert_payload_finite,
+    make_offer_performance,
+    make_targets,
+    make_tracker,
+    xml_part_crcs,
+)
 
 
 # ---------------------------------------------------------------------------
-# Synthetic CoWork data factories
+# Helpers
 # ---------------------------------------------------------------------------
 
-def _make_raw_data(year, month, days=None, channels=None):
-    """Build a synthetic RAW DATA DataFrame matching CoWork tracker schema."""
-    if channels is None:
-        channels = REPORT_CHANNELS
-    if days is None:
-        days = list(range(1, 29))
-
-    rows = []
-    for day in days:
-        for ch in channels:
-            rows.append({
-                "COS Year": year,
-                "COS Month": month,
-                "COS Day": day,
-                "COS Channel": ch,
-                "COS Locale": "en_US",
-                "COS Orders": 10,
-                "COS New Customers": 5,
-                "COS COS%": 0.10,
-                "COS CAC": 20.0,
-                "COS CPA": 10.0,
-                "COS Cost": 100.0,
-                "COS Revenue": 1000.0,
-                "COS Sessions": 200,
-                "COS AOV": 100.0,
-                "COS Conversion": 0.05,
-            })
-    return pd.DataFrame(rows)
-
-
-def _make_targets(year, month, channels=None):
-    """Build a synthetic Targets DataFrame matching CoWork target schema."""
-    if channels is None:
-        channels = REPORT_CHANNELS
-    num_days = calendar.monthrange(year, month)[1]
-
-    rows = []
-    for day in range(1, num_days + 1):
-        for ch in channels:
-            rows.append({
-                "Target_Type_Id": "Daily",
-                "Date": pd.Timestamp(year, month, day),
-                "Site_Id": "No 7",
-                "Locale_Id": "en_US",
-                "Channel_Id": ch,
-                "Notes": float("nan"),
-                "Gross_Revenue_Target": 900.0,
-                "Net_Revenue_Target": 850.0,
-                "Marketing_Spend_Target": 90.0,
-                "Session_Target": 180,
-                "Order_Target": 9,
-                "New_Customer_Target": 4,
-            })
-    return pd.DataFrame(rows)
-
-
-def _make_tracker(year, month, ly_year=None, ly_month=None):
-    """Build tracker dict with RAW DATA for current + prior year."""
-    if ly_year is None:
-        ly_year = year - 1
-    if ly_month is None:
-        ly_month = month
-    raw_cur = _make_raw_data(year, month)
-    raw_ly = _make_raw_data(ly_year, ly_month)
-    raw = pd.concat([raw_cur, raw_ly], ignore_index=True)
-    return {"RAW DATA": raw}
-
-
-def _make_offer_performance(month):
-    """Build synthetic offer performance DataFrame (CoWork promo format)."""
-    rows = []
-    promos = ["Promo A", "Promo B", "Promo C"]
-    channels = ["AFFILIATE", "EMAIL", "PPC"]
-    for promo in promos:
-        for ch in channels:
-            rows.append({
-                "Dimension 1": promo,
-                "Dimension 2": ch,
-                "Dimension 3": str(month),
-                "Dimension 4": "Total",
-                "Redemptions": 1000.0,
-                "% Change Redemptions": -0.10,
-                "Revenue": 50000.0,
-                "% Change Revenue": 0.15,
-                "Discount Amount": 5000.0,
-                "% Change Discount Amount": -0.05,
-            })
-    rows.append({
-        "Dimension 1": "Grand Total",
-        "Dimension 2": "Total",
-        "Dimension 3": "Total",
-        "Dimension 4": "Total",
-        "Redemptions": 9000.0,
-        "% Change Redemptions": -0.10,
-        "Revenue": 450000.0,
-        "% Change Revenue": 0.15,
-        "Discount Amount": 45000.0,
-        "% Change Discount Amount": -0.05,
-    })
-    return pd.DataFrame(rows)
-
-
-def _make_product_sales(month):
-    """Build synthetic product sales DataFrame (CoWork product format)."""
-    rows = []
-    products = ["Product X", "Product Y", "Product Z"]
-    for prod in products:
-        rows.append({
-            "Dimension 1": prod,
-            "Dimension 2": str(month),
-            "Dimension 3": "Total",
-            "Units (Analysis)": 500.0,
-            "Units (Comparison)": 400.0,
-            "Units (vs. Comp)": 0.25,
-            "Total Revenue (Analysis)": 25000.0,
-            "Total Revenue (Comparison)": 20000.0,
-            "Total Revenue (vs. Comp)": 0.25,
-            "AOV (Analysis)": 50.0,
-            "Avg. Selling Price (Analysis)": 45.0,
-            "Total Discount % (Analysis)": 0.10,
-            "New Customers (Analysis)": 100.0,
-        })
-    rows.append({
-        "Dimension 1": "Grand Total",
-        "Dimension 2": "Total",
-        "Dimension 3": "Total",
-        "Units (Analysis)": 1500.0,
-        "Units (Comparison)": 1200.0,
-        "Units (vs. Comp)": 0.25,
-        "Total Revenue (Analysis)": 75000.0,
-        "Total Revenue (Comparison)": 60000.0,
-        "Total Revenue (vs. Comp)": 0.25,
-        "AOV (Analysis)": 50.0,
-        "Avg. Selling Price (Analysis)": 45.0,
-        "Total Discount % (Analysis)": 0.10,
-        "New Customers (Analysis)": 300.0,
-    })
-    return pd.DataFrame(rows)
-
-
-def _make_crm():
-    """Build synthetic CRM performance DataFrame (CoWork email format)."""
-    return pd.DataFrame([
-        {
-            "Col A": "Grand Total", "Col B": "Total", "Col C": "Total",
-            "Emails Sent": 50000, "Emails Sent vs Comp": -0.05,
-            "Open Rate": 0.25, "Open Rate vs Comp": 0.02,
-            "Click-Through Rate": 0.08, "Click-Through Rate vs Comp": -0.01,
-            "Sessions": 10000, "Sessions vs Comp": 0.10,
-            "Orders": 500, "Orders vs Comp": 0.20,
-            "CVR": 0.05, "CVR vs Comp": 0.005,
-            "Revenue": 75000.0, "Revenue vs Comp": 0.15,
-            "AOV": 150.0, "AOV vs Comp": -0.03,
-        },
-        {
-            "Col A": "Grand Total", "Col B": "Total", "Col C": "Manual",
-            "Emails Sent": 30000, "Emails Sent vs Comp": -0.03,
-            "Open Rate": 0.22, "Open Rate vs Comp": 0.01,
-            "Click-Through Rate": 0.07, "Click-Through Rate vs Comp": -0.005,
-            "Sessions": 6000, "Sessions vs Comp": 0.08,
-            "Orders": 300, "Orders vs Comp": 0.18,
-            "CVR": 0.05, "CVR vs Comp": 0.004,
-            "Revenue": 45000.0, "Revenue vs Comp": 0.12,
-            "AOV": 150.0, "AOV vs Comp": -0.02,
-        },
-        {
-            "Col A": "Grand Total", "Col B": "Total", "Col C": "Automated",
-            "Emails Sent": 20000, "Emails Sent vs Comp": -0.08,
-            "Open Rate": 0.30, "Open Rate vs Comp": 0.03,
-            "Click-Through Rate": 0.10, "Click-Through Rate vs Comp": -0.02,
-            "Sessions": 4000, "Sessions vs Comp": 0.12,
-            "Orders": 200, "Orders vs Comp": 0.22,
-            "CVR": 0.05, "CVR vs Comp": 0.006,
-            "Revenue": 30000.0, "Revenue vs Comp": 0.20,
-            "AOV": 150.0, "AOV vs Comp": -0.05,
-        },
-    ])
-
-
-def _make_affiliate():
-    """Build synthetic affiliate publisher DataFrame (CoWork affiliate format)."""
-    rows = [
-        {
-            "Dimension 1": "Grand Total",
-            "Dimension 2": "All Publishers",
-            "Dimension 3": "Total",
-            "Influencer Filter": "Total",
-            "Revenue (Analysis)": 100000.0,
-            "Revenue (Comparison)": 80000.0,
-            "Revenue (vs Comp)": 0.25,
-            "Cost (Analysis)": 10000.0,
-            "Cost (Comparison)": 9000.0,
-            "Cost (vs Comp)": 0.111,
-            "CoS (Analysis)": 0.10,
-            "CoS (vs Comp)": -0.01,
-            "Orders (Analysis)": 1000,
-            "Orders (vs Comp)": 0.20,
-            "CVR (Analysis)": 0.05,
-            "CVR (vs Comp)": 0.005,
-            "Sessions (Analysis)": 20000,
-            "AOV (Analysis)": 100.0,
-            "Total Commission (Analysis)": 8000.0,
-        },
-    ]
-    for i, name in enumerate(["Publisher A", "Publisher B", "Publisher C"]):
-        rows.append({
-            "Dimension 1": str(1000 + i),
-            "Dimension 2": name,
-            "Dimension 3": "Total",
-            "Influencer Filter": "Affiliate",
-            "Revenue (Analysis)": 30000.0 - i * 5000,
-            "Revenue (Comparison)": 25000.0 - i * 5000,
-            "Revenue (vs Comp)": 0.20,
-            "Cost (Analysis)": 3000.0 - i * 500,
-            "Cost (Comparison)": 2500.0 - i * 500,
-            "Cost (vs Comp)": 0.20,
-            "CoS (Analysis)": 0.10,
-            "CoS (vs Comp)": -0.005,
-            "Orders (Analysis)": 300 - i * 50,
-            "Orders (vs Comp)": 0.15,
-            "CVR (Analysis)": 0.05,
-            "CVR (vs Comp)": 0.003,
-            "Sessions (Analysis)": 6000 - i * 1000,
-            "AOV (Analysis)": 100.0,
-            "Total Commission (Analysis)": 2500.0 - i * 400,
-        })
-    return pd.DataFrame(rows)
+# Payload values implied by the factories for January 2026: RAW DATA has
+# 9 channels × 28 days at $1000 revenue, 10 orders and 200 sessions each.
+_EXPECTED_JAN_2026 = {
+    "cover.total_revenue": 9 * 28 * 1000.0,
+    "cover.total_orders": 9 * 28 * 10,
+    "cover.aov": 100.0,
+    "seo.revenue": 28 * 1000.0,    # ORGANIC channel only
+    "seo.sessions": 28 * 200,
+}
+
 
+def _slide_has_text(slide, needle: str) -> bool:
+    """Whether any text frame on a slide contains ``needle``."""
+    return any(
+        needle in shape.text_frame.text
+        for shape in slide.shapes if shape.has_text_frame
+    )
 
-def _all_sources(year, month):
-    """Build a complete set of CoWork data sources for a given month."""
-    return {
-        "tracker": _make_tracker(year, month),
-        "targets": _make_targets(year, month),
-        "offer_performance": _make_offer_performance(month),
-        "product_sales": _make_product_sales(month),
-        "crm": _make_crm(),
-        "affiliate": _make_affiliate(),
-    }
+
+def _structural_errors(qa_result: QAResult) -> list:
+    """Slide-count and dimension errors from a QA result."""
+    grouped = qa_result.errors_by_category
+    return grouped.get("slide_count", []) + grouped.get("dimensions", [])
 
 
 def _bytes_to_prs(pptx_bytes: bytes) -> Presentation:
@@ -284,260 +69,275 @@ def _bytes_to_prs(pptx_bytes: bytes) -> Presentation:
 # Fixtures
 # ---------------------------------------------------------------------------
 
-@pytest.fixture
+# The pipeline is deterministic and never mutates its inputs, so the
+# January artifacts are built once per session and shared read-only. Tests
+# that use them carry the ``_JAN_GROUP`` mark so that, under
+# ``pytest -n auto --dist=loadgroup``, a single worker builds them.
+
+_JAN_GROUP = pytest.mark.xdist_group("2026-01")
+
+
+@pytest.fixture(scope="session")
 def monthly_schema():
     return build_monthly_report_schema()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def qbr_schema():
     return build_qbr_schema()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def monthly_slot_keys(monthly_schema):
+    """Top-level payload keys the monthly slots read.
+
+    Unlike ``TemplateSchema.all_data_keys`` this leaves out table column
+    keys, which name fields inside rows rather than payload entries.
+    """
+    keys = set()
+    for slide in monthly_schema.slides:
+        for slot in slide.slots:
+            for key in (slot.data_key, slot.variance_key, slot.row_data_key,
+                        slot.categories_key):
+                if key:
+                    keys.add(key)
+            keys.update(series.data_key for series in slot.series)
+    return frozenset(keys)
+
+
+@pytest.fixture(scope="session")
 def jan_sources():
     """All CoWork data sources for January 2026."""
-    return _all_sources(2026, 1)
+    return all_sources(2026, 1)
+
+
+@pytest.fixture(scope="session")
+def jan_mapped_result(monthly_schema, jan_sources):
+    """January 2026 sources mapped onto the monthly schema."""
+    return DataMapper(monthly_schema, month=1, year=2026).map(jan_sources)
+
+
+@pytest.fixture(scope="session")
+def jan_pptx_bytes(monthly_schema, jan_mapped_result):
+    """The January 2026 monthly deck."""
+    return PPTXBuilder(monthly_schema).build(jan_mapped_result.payload)
+
+
+@pytest.fixture(scope="session")
+def jan_report_file(tmp_path_factory, monthly_schema, jan_mapped_result):
+    """The January deck written once via ``build_to_file``."""
+    output = tmp_path_factory.mktemp("output") / "No7_US_January_2026_Report.pptx"
+    PPTXBuilder(monthly_schema).build_to_file(jan_mapped_result.payload, output)
+    return output
+
+
+@pytest.fixture(scope="session")
+def jan_prs(jan_pptx_bytes):
+    """The January deck parsed once; tests must only read from it."""
+    return _bytes_to_prs(jan_pptx_bytes)
+
+
+@pytest.fixture(scope="session")
+def jan_qa_result(monthly_schema, jan_mapped_result, jan_pptx_bytes):
+    """Full QA pass over the January deck; tests filter it by category."""
+    return QAValidator(monthly_schema).validate(
+        jan_pptx_bytes, jan_mapped_result.payload,
+    )
+
+
+@pytest.fixture(scope="session")
+def empty_mapped_result(monthly_schema):
+    """Mapping with no data sources at all."""
+    return DataMapper(monthly_schema, month=1, year=2026).map({})
+
+
+@pytest.fixture(scope="session")
+def empty_pptx_bytes(monthly_schema, empty_mapped_result):
+    return PPTXBuilder(monthly_schema).build(empty_mapped_result.payload)
+
+
+@pytest.fixture(scope="session")
+def empty_qa_result(monthly_schema, empty_mapped_result, empty_pptx_bytes):
+    return QAValidator(monthly_schema).validate(
+        empty_pptx_bytes, empty_mapped_result.payload,
+    )
+
+
+@pytest.fixture(scope="session")
+def monthly_blank_bytes(monthly_schema):
+    """The monthly deck built from an empty payload (no mapping)."""
+    return PPTXBuilder(monthly_schema).build({})
+
+
+@pytest.fixture(scope="session")
+def qbr_blank_bytes(qbr_schema):
+    """The QBR deck built from an empty payload."""
+    return PPTXBuilder(qbr_schema).build({})
+
+
+@pytest.fixture(scope="session")
+def qbr_blank_prs(qbr_blank_bytes):
+    return _bytes_to_prs(qbr_blank_bytes)
+
+
+@pytest.fixture(scope="session")
+def monthly_blank_qa_result(monthly_schema, monthly_blank_bytes):
+    return QAValidator(monthly_schema).validate(monthly_blank_bytes, {})
+
+
+@pytest.fixture(scope="session")
+def qbr_blank_qa_result(qbr_schema, qbr_blank_bytes):
+    return QAValidator(qbr_schema).validate(qbr_blank_bytes, {})
+
+
+@pytest.fixture(scope="session")
+def month_result(request, monthly_schema):
+    """Mapped result for an indirectly parametrized ``(year, month)``.
+
+    Only the selected tests' months are mapped. pytest keeps the instance
+    while tests sharing its param index run back to back; tests that list the
+    same month at a different position in their parametrize map it again.
+    """
+    year, month = request.param
+    if (year, month) == (2026, 1):
+        return request.getfixturevalue("jan_mapped_result")
+    mapper = DataMapper(monthly_schema, month=month, year=year)
+    return mapper.map(all_sources(year, month))
+
+
+def _month_param(year, month, *values):
+    """A ``(year, month)`` param for ``month_result``, pinned to one xdist group.
+
+    Under ``--dist=loadgroup`` every test for a given month runs on the same
+    worker, so the month is mapped on that worker only.
+    """
+    key = f"{year}-{month:02d}"
+    return pytest.param(
+        (year, month), *values,
+        marks=pytest.mark.xdist_group(key),
+        id="-".join([key, *map(str, values)]),
+    )
 
 
 # ---------------------------------------------------------------------------
 # Monthly E2E: full pipeline
 # ---------------------------------------------------------------------------
 
+@_JAN_GROUP
 class TestMonthlyFullPipeline:
     """Synthetic CoWork data → DataMapper → PPTXBuilder → QAValidator."""
 
-    def test_full_pipeline_produces_valid_pptx(self, monthly_schema, jan_sources):
-        """The complete pipeline should produce a QA-passing presentation."""
-        mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map(jan_sources)
-        builder = PPTXBuilder(monthly_schema)
-        pptx_bytes = builder.build(result.payload)
-        qa = QAValidator(monthly_schema)
-        qa_result = qa.validate(pptx_bytes, result.payload)
-
-        structural = [i for i in qa_result.errors
-                      if i.category in ("slide_count", "dimensions")]
-        assert len(structural) == 0
-
-    def test_full_pipeline_14_slides(self, monthly_schema, jan_sources):
-        mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map(jan_sources)
-        pptx_bytes = PPTXBuilder(monthly_schema).build(result.payload)
-        prs = _bytes_to_prs(pptx_bytes)
-        assert len(prs.slides) == 14
+    def test_full_pipeline_14_slides(self, jan_prs):
+        assert len(jan_prs.slides) == 14
 
-    def test_full_pipeline_correct_dimensions(self, monthly_schema, jan_sources):
-        mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map(jan_sources)
-        pptx_bytes = PPTXBuilder(monthly_schema).build(result.payload)
-        prs = _bytes_to_prs(pptx_bytes)
-        assert prs.slide_width == Inches(13.333)
-        assert prs.slide_height == Inches(7.5)
+    def test_full_pipeline_correct_dimensions(self, jan_prs):
+        assert jan_prs.slide_width == Inches(13.333)
+        assert jan_prs.slide_height == Inches(7.5)
 
-    def test_full_pipeline_high_coverage(self, monthly_schema, jan_sources):
+    def test_full_pipeline_high_coverage(self, jan_mapped_result):
         """With all data sources, mapper should achieve high coverage."""
-        mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map(jan_sources)
-        assert result.coverage > 0.7
+        assert jan_mapped_result.coverage > 0.7
 
-    def test_full_pipeline_no_nan_in_payload(self, monthly_schema, jan_sources):
+    def test_full_pipeline_no_nan_in_payload(self, jan_mapped_result):
         """The mapper must never leak NaN/inf into the payload."""
-        mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map(jan_sources)
-
-        for key, val in result.payload.items():
-            if isinstance(val, float):
-                assert not math.isnan(val), f"{key} is NaN"
-                assert not math.isinf(val), f"{key} is inf"
-            elif isinstance(val, list):
-                for item in val:
-                    if isinstance(item, float):
-                        assert not math.isnan(item), f"{key} list has NaN"
-                    elif isinstance(item, dict):
-                        for k, v in item.items():
-                            if isinstance(v, float):
-                                assert not math.isnan(v), f"{key}[].{k} is NaN"
-                                assert not math.isinf(v), f"{key}[].{k} is inf"
-
-    def test_full_pipeline_payload_validates(self, monthly_schema, jan_sources):
+        assert_payload_finite(jan_mapped_result.payload)
+
+    def test_full_pipeline_payload_validates(self, monthly_schema, jan_mapped_result):
         """Mapper output should pass QA payload-only validation."""
-        mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map(jan_sources)
         qa = QAValidator(monthly_schema)
-        payload_result = qa.validate_payload(result.payload)
+        payload_result = qa.validate_payload(jan_mapped_result.payload)
         assert len(payload_result.errors) == 0
 
-    def test_full_pipeline_no_table_errors(self, monthly_schema, jan_sources):
-        """Tables rendered from mapper data should pass QA validation."""
-        mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map(jan_sources)
-        pptx_bytes = PPTXBuilder(monthly_schema).build(result.payload)
-        qa_result = QAValidator(monthly_schema).validate(pptx_bytes, result.payload)
-
-        table_errors = [i for i in qa_result.errors
-                        if i.category.startswith("table_")]
-        assert len(table_errors) == 0
-
-    def test_full_pipeline_no_chart_errors(self, monthly_schema, jan_sources):
-        """Charts rendered from mapper data should pass QA validation."""
-        mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map(jan_sources)
-        pptx_bytes = PPTXBuilder(monthly_schema).build(result.payload)
-        qa_result = QAValidator(monthly_schema).validate(pptx_bytes, result.payload)
-
-        chart_errors = [i for i in qa_result.errors
-                        if i.category.startswith("chart_")]
-        assert len(chart_errors) == 0
-
-    def test_full_pipeline_no_kpi_errors(self, monthly_schema, jan_sources):
-        """KPIs rendered from mapper data should pass QA validation."""
-        mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map(jan_sources)
-        pptx_bytes = PPTXBuilder(monthly_schema).build(result.payload)
-        qa_result = QAValidator(monthly_schema).validate(pptx_bytes, result.payload)
-
-        kpi_errors = [i for i in qa_result.errors
-                      if i.category.startswith("kpi_")]
-        assert len(kpi_errors) == 0
-
-    def test_full_pipeline_divider_backgrounds(self, monthly_schema, jan_sources):
-        """Divider slides should have brand-blue backgrounds."""
-        mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map(jan_sources)
-        pptx_bytes = PPTXBuilder(monthly_schema).build(result.payload)
-        qa_result = QAValidator(monthly_schema).validate(pptx_bytes, result.payload)
-
-        bg_errors = [i for i in qa_result.errors
-                     if i.category == "divider_background"]
-        assert len(bg_errors) == 0
+    @pytest.mark.parametrize("in_category", [
+        lambda c: c in ("slide_count", "dimensions"),
+        lambda c: c.startswith("table_"),
+        lambda c: c.startswith("chart_"),
+        lambda c: c.startswith("kpi_"),
+        lambda c: c == "divider_background",
+    ], ids=["structural", "table", "chart", "kpi", "divider_background"])
+    def test_full_pipeline_no_errors_in_category(self, jan_qa_result, in_category):
+        """Slides rendered from mapper data should pass each QA category."""
+        errors = [i for i in jan_qa_result.errors if in_category(i.category)]
+        assert errors == []
 
 
 # ---------------------------------------------------------------------------
 # Monthly E2E: data accuracy
 # ---------------------------------------------------------------------------
 
+@_JAN_GROUP
 class TestMonthlyDataAccuracy:
     """Verify that generated slides contain the correct data values."""
 
-    def test_cover_revenue_matches_input(self, monthly_schema, jan_sources):
-        """Cover slide revenue should match aggregated tracker data."""
-        mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map(jan_sources)
-
-        # 9 channels × 28 days × $1000 = $252,000
-        expected_revenue = 9 * 28 * 1000.0
-        assert result.payload["cover.total_revenue"] == expected_revenue
-
-        # Verify it renders on the slide
-        pptx_bytes = PPTXBuilder(monthly_schema).build(result.payload)
-        prs = _bytes_to_prs(pptx_bytes)
-        cover = prs.slides[0]
-        all_text = " ".join(
-            s.text_frame.text for s in cover.shapes if s.has_text_frame
-        )
-        assert "$252k" in all_text
-
-    def test_cover_orders_matches_input(self, monthly_schema, jan_sources):
-        mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map(jan_sources)
-        expected_orders = 9 * 28 * 10
-        assert result.payload["cover.total_orders"] == expected_orders
+    @pytest.mark.parametrize("key, expected", _EXPECTED_JAN_2026.items(),
+                             ids=list(_EXPECTED_JAN_2026))
+    def test_payload_matches_input(self, jan_mapped_result, key, expected):
+        """Aggregates should match the synthetic tracker data."""
+        assert jan_mapped_result.payload[key] == expected
 
-    def test_cover_aov_correct(self, monthly_schema, jan_sources):
-        mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map(jan_sources)
-        # AOV = revenue / orders = (9*28*1000) / (9*28*10) = 100.0
-        assert result.payload["cover.aov"] == pytest.approx(100.0)
+    def test_cover_revenue_rendered(self, jan_prs):
+        assert _slide_has_text(jan_prs.slides[0], "$252k")
 
-    def test_exec_table_row_count(self, monthly_schema, jan_sources):
+    def test_exec_table_row_count(self, jan_mapped_result):
         """Executive summary table should have TOTAL + 9 channel rows."""
-        mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map(jan_sources)
-        rows = result.payload["exec.performance_rows"]
+        rows = jan_mapped_result.payload["exec.performance_rows"]
         assert len(rows) == 10  # TOTAL + 9 channels
 
-    def test_exec_table_total_row_first(self, monthly_schema, jan_sources):
-        mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map(jan_sources)
-        assert result.payload["exec.performance_rows"][0]["channel"] == "TOTAL"
+    def test_exec_table_total_row_first(self, jan_mapped_result):
+        rows = jan_mapped_result.payload["exec.performance_rows"]
+        assert rows[0]["channel"] == "TOTAL"
 
-    def test_exec_yoy_variance_zero(self, monthly_schema, jan_sources):
+    def test_exec_yoy_variance_zero(self, jan_mapped_result):
         """With identical TY and LY data, YoY variance should be 0%."""
-        mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map(jan_sources)
-        total_row = result.payload["exec.performance_rows"][0]
+        total_row = jan_mapped_result.payload["exec.performance_rows"][0]
         assert total_row["revenue_vs_ly"] == 0.0
 
-    def test_daily_series_length_matches_month(self, monthly_schema, jan_sources):
+    def test_daily_series_length_matches_month(self, jan_mapped_result):
         """Daily series should have exactly as many values as days in January."""
-        mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map(jan_sources)
-        assert len(result.payload["daily.dates"]) == 31
-        assert len(result.payload["daily.revenue_actual"]) == 31
-        assert len(result.payload["daily.revenue_target"]) == 31
+        assert len(jan_mapped_result.payload["daily.dates"]) == 31
+        assert len(jan_mapped_result.payload["daily.revenue_actual"]) == 31
+        assert len(jan_mapped_result.payload["daily.revenue_target"]) == 31
 
-    def test_daily_chart_rendered(self, monthly_schema, jan_sources):
+    def test_daily_chart_rendered(self, jan_prs):
         """Daily performance slide should have chart shapes."""
-        mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map(jan_sources)
-        pptx_bytes = PPTXBuilder(monthly_schema).build(result.payload)
-        prs = _bytes_to_prs(pptx_bytes)
-        daily_slide = prs.slides[4]
+        daily_slide = jan_prs.slides[4]
         charts = [s for s in daily_slide.shapes if s.has_chart]
         assert len(charts) >= 1
 
-    def test_promo_rows_from_offer_data(self, monthly_schema, jan_sources):
+    def test_promo_rows_from_offer_data(self, jan_mapped_result):
         """Promo rows should come from offer_performance data."""
-        mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map(jan_sources)
-        promo_rows = result.payload["promo.rows"]
+        promo_rows = jan_mapped_result.payload["promo.rows"]
         # 3 promos × 3 channels = 9 rows
         assert len(promo_rows) == 9
         names = {r["promotion_name"] for r in promo_rows}
         assert "Promo A" in names
         assert "Grand Total" not in names
 
-    def test_product_rows_from_product_data(self, monthly_schema, jan_sources):
-        mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map(jan_sources)
-        product_rows = result.payload["product.rows"]
+    def test_product_rows_from_product_data(self, jan_mapped_result):
+        product_rows = jan_mapped_result.payload["product.rows"]
         assert len(product_rows) == 3
         assert "Grand Total" not in {r["product_name"] for r in product_rows}
 
-    def test_crm_kpis_from_crm_data(self, monthly_schema, jan_sources):
-        mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map(jan_sources)
-        assert result.payload["crm.emails_sent"] == 50000
-        assert result.payload["crm.revenue"] == 75000.0
+    def test_crm_kpis_from_crm_data(self, jan_mapped_result):
+        assert jan_mapped_result.payload["crm.emails_sent"] == 50000
+        assert jan_mapped_result.payload["crm.revenue"] == 75000.0
 
-    def test_affiliate_kpis_from_affiliate_data(self, monthly_schema, jan_sources):
-        mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map(jan_sources)
-        assert result.payload["affiliate.revenue"] == 100000.0
-        assert result.payload["affiliate.roas"] == pytest.approx(10.0)
+    def test_affiliate_kpis_from_affiliate_data(self, jan_mapped_result):
+        assert jan_mapped_result.payload["affiliate.revenue"] == 100000.0
+        assert jan_mapped_result.payload["affiliate.roas"] == 10.0
 
-    def test_affiliate_publisher_rows_sorted(self, monthly_schema, jan_sources):
-        mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map(jan_sources)
-        rows = result.payload["affiliate.publisher_rows"]
+    def test_affiliate_publisher_rows_sorted(self, jan_mapped_result):
+        rows = jan_mapped_result.payload["affiliate.publisher_rows"]
         assert len(rows) == 3
         assert rows[0]["publisher_name"] == "Publisher A"
         # Revenue should be descending
         revenues = [r["revenue"] for r in rows]
         assert revenues == sorted(revenues, reverse=True)
 
-    def test_seo_from_organic_channel(self, monthly_schema, jan_sources):
-        mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map(jan_sources)
-        assert result.payload["seo.revenue"] == 28 * 1000.0
-        assert result.payload["seo.sessions"] == 28 * 200
-
-    def test_report_title_and_period(self, monthly_schema, jan_sources):
-        mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map(jan_sources)
-        assert result.payload["cover.report_title"] == "No7 US x THGi Monthly eComm Report"
-        assert result.payload["cover.report_period"] == "January 2026 Overview"
+    def test_report_title_and_period(self, jan_mapped_result):
+        payload = jan_mapped_result.payload
+        assert payload["cover.report_title"] == "No7 US x THGi Monthly eComm Report"
+        assert payload["cover.report_period"] == "January 2026 Overview"
 
 
 # ---------------------------------------------------------------------------
@@ -550,7 +350,7 @@ class TestMonthlyPartialData:
     def test_tracker_only(self, monthly_schema):
         """Only tracker data → cover/exec/daily/seo slides populated."""
         mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map({"tracker": _make_tracker(2026, 1)})
+        result = mapper.map({"tracker": make_tracker(2026, 1)})
         pptx_bytes = PPTXBuilder(monthly_schema).build(result.payload)
         prs = _bytes_to_prs(pptx_bytes)
 
@@ -560,33 +360,23 @@ class TestMonthlyPartialData:
         assert result.payload["product.rows"] == []
         assert len(result.warnings) > 0
 
-    def test_no_data_sources(self, monthly_schema):
+    def test_no_data_sources(self, empty_mapped_result, empty_pptx_bytes):
         """Empty sources should still produce 14-slide PPTX."""
-        mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map({})
-        pptx_bytes = PPTXBuilder(monthly_schema).build(result.payload)
-        prs = _bytes_to_prs(pptx_bytes)
+        prs = _bytes_to_prs(empty_pptx_bytes)
 
         assert len(prs.slides) == 14
-        assert result.coverage > 0.0  # Static slides provide some coverage
-        assert result.coverage < 1.0
+        assert empty_mapped_result.coverage > 0.0  # Static slides provide some coverage
+        assert empty_mapped_result.coverage < 1.0
 
-    def test_no_data_qa_no_structural_errors(self, monthly_schema):
+    def test_no_data_qa_no_structural_errors(self, empty_qa_result):
         """Empty sources → no structural QA errors."""
-        mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map({})
-        pptx_bytes = PPTXBuilder(monthly_schema).build(result.payload)
-        qa_result = QAValidator(monthly_schema).validate(pptx_bytes, result.payload)
-
-        structural = [i for i in qa_result.errors
-                      if i.category in ("slide_count", "dimensions")]
-        assert len(structural) == 0
+        assert _structural_errors(empty_qa_result) == []
 
     def test_tracker_and_targets_only(self, monthly_schema):
         mapper = DataMapper(monthly_schema, month=1, year=2026)
         sources = {
-            "tracker": _make_tracker(2026, 1),
-            "targets": _make_targets(2026, 1),
+            "tracker": make_tracker(2026, 1),
+            "targets": make_targets(2026, 1),
         }
         result = mapper.map(sources)
         pptx_bytes = PPTXBuilder(monthly_schema).build(result.payload)
@@ -599,7 +389,7 @@ class TestMonthlyPartialData:
     def test_offer_performance_only(self, monthly_schema):
         mapper = DataMapper(monthly_schema, month=1, year=2026)
         result = mapper.map({
-            "offer_performance": _make_offer_performance(1),
+            "offer_performance": make_offer_performance(1),
         })
         assert len(result.payload["promo.rows"]) == 9
         assert result.payload["exec.performance_rows"] == []
@@ -612,50 +402,49 @@ class TestMonthlyPartialData:
 class TestMonthlyMultiMonth:
     """Pipeline should work correctly for any month."""
 
-    @pytest.mark.parametrize("month,month_name", [
-        (1, "January"), (3, "March"), (6, "June"),
-        (9, "September"), (12, "December"),
-    ])
-    def test_report_period_correct(self, monthly_schema, month, month_name):
-        mapper = DataMapper(monthly_schema, month=month, year=2026)
-        result = mapper.map(_all_sources(2026, month))
-        assert result.payload["cover.report_period"] == f"{month_name} 2026 Overview"
-
-    @pytest.mark.parametrize("month", [1, 2, 6, 12])
-    def test_daily_series_length(self, monthly_schema, month):
+    @pytest.mark.parametrize("month_result, month_name", [
+        _month_param(2026, 1, "January"), _month_param(2026, 3, "March"),
+        _month_param(2026, 6, "June"), _month_param(2026, 9, "September"),
+        _month_param(2026, 12, "December"),
+    ], indirect=["month_result"])
+    def test_report_period_correct(self, month_result, month_name):
+        period = month_result.payload["cover.report_period"]
+        assert period == f"{month_name} 2026 Overview"
+
+    @pytest.mark.parametrize("month_result, expected_days", [
+        _month_param(2026, 1, 31), _month_param(2026, 2, 28),
+        _month_param(2026, 6, 30), _month_param(2026, 12, 31),
+    ], indirect=["month_result"])
+    def test_daily_series_length(self, month_result, expected_days):
         """Daily series length should match days in that month."""
-        mapper = DataMapper(monthly_schema, month=month, year=2026)
-        result = mapper.map(_all_sources(2026, month))
-        expected_days = calendar.monthrange(2026, month)[1]
-        assert len(result.payload["daily.dates"]) == expected_days
-
-    def test_february_non_leap_year(self, monthly_schema):
-        mapper = DataMapper(monthly_schema, month=2, year=2026)
-        result = mapper.map(_all_sources(2026, 2))
-        assert len(result.payload["daily.dates"]) == 28
-
-    def test_february_leap_year(self, monthly_schema):
-        mapper = DataMapper(monthly_schema, month=2, year=2024)
-        result = mapper.map(_all_sources(2024, 2))
-        assert len(result.payload["daily.dates"]) == 29
-
-    @pytest.mark.parametrize("month", [1, 6, 12])
-    def test_full_pipeline_any_month(self, monthly_schema, month):
+        assert len(month_result.payload["daily.dates"]) == expected_days
+
+    @pytest.mark.parametrize("month_result", [_month_param(2026, 2)], indirect=True)
+    def test_february_non_leap_year(self, month_result):
+        assert len(month_result.payload["daily.dates"]) == 28
+
+    @pytest.mark.parametrize("month_result", [_month_param(2024, 2)], indirect=True)
+    def test_february_leap_year(self, month_result):
+        assert len(month_result.payload["daily.dates"]) == 29
+
+    @pytest.mark.parametrize("month_result", [
+        _month_param(2026, 1), _month_param(2026, 6), _month_param(2026, 12),
+    ], indirect=True)
+    def test_full_pipeline_any_month(self, monthly_schema, month_result):
         """Full pipeline should pass for any month."""
-        mapper = DataMapper(monthly_schema, month=month, year=2026)
-        result = mapper.map(_all_sources(2026, month))
-        pptx_bytes = PPTXBuilder(monthly_schema).build(result.payload)
-        qa_result = QAValidator(monthly_schema).validate(pptx_bytes, result.payload)
+        pptx_bytes = PPTXBuilder(monthly_schema).build(month_result.payload)
+        qa_result = QAValidator(monthly_schema).validate(
+            pptx_bytes, month_result.payload
+        )
 
-        structural = [i for i in qa_result.errors
-                      if i.category in ("slide_count", "dimensions")]
-        assert len(structural) == 0
+        assert _structural_errors(qa_result) == []
 
 
 # ---------------------------------------------------------------------------
 # Monthly E2E: idempotency and consistency
 # ---------------------------------------------------------------------------
 
+@_JAN_GROUP
 class TestMonthlyIdempotency:
     """Pipeline should produce identical output for identical input."""
 
@@ -666,22 +455,17 @@ class TestMonthlyIdempotency:
         assert r1.payload == r2.payload
         assert r1.coverage == r2.coverage
 
-    def test_builder_idempotent(self, monthly_schema, jan_sources):
+    def test_builder_idempotent(self, monthly_schema, jan_mapped_result):
         """Two builds from same payload should produce same slide count."""
-        mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map(jan_sources)
         builder = PPTXBuilder(monthly_schema)
-        prs1 = _bytes_to_prs(builder.build(result.payload))
-        prs2 = _bytes_to_prs(builder.build(result.payload))
+        prs1 = _bytes_to_prs(builder.build(jan_mapped_result.payload))
+        prs2 = _bytes_to_prs(builder.build(jan_mapped_result.payload))
         assert len(prs1.slides) == len(prs2.slides)
 
-    def test_qa_idempotent(self, monthly_schema, jan_sources):
-        mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map(jan_sources)
-        pptx_bytes = PPTXBuilder(monthly_schema).build(result.payload)
+    def test_qa_idempotent(self, monthly_schema, jan_mapped_result, jan_pptx_bytes):
         qa = QAValidator(monthly_schema)
-        r1 = qa.validate(pptx_bytes, result.payload)
-        r2 = qa.validate(pptx_bytes, result.payload)
+        r1 = qa.validate(jan_pptx_bytes, jan_mapped_result.payload)
+        r2 = qa.validate(jan_pptx_bytes, jan_mapped_result.payload)
         assert r1.error_count == r2.error_count
         assert r1.warning_count == r2.warning_count
 
@@ -690,73 +474,49 @@ class TestMonthlyIdempotency:
 # Monthly E2E: file output
 # ---------------------------------------------------------------------------
 
+@_JAN_GROUP
 class TestMonthlyFileOutput:
     """Pipeline should write valid PPTX to disk."""
 
-    def test_build_to_file(self, monthly_schema, jan_sources, tmp_path):
-        mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map(jan_sources)
-        output = tmp_path / "No7_US_January_2026_Report.pptx"
-        PPTXBuilder(monthly_schema).build_to_file(result.payload, output)
-
-        assert output.exists()
-        assert output.stat().st_size > 0
-        prs = Presentation(str(output))
+    def test_build_to_file(self, jan_report_file):
+        assert jan_report_file.exists()
+        assert jan_report_file.stat().st_size > 0
+        prs = Presentation(str(jan_report_file))
         assert len(prs.slides) == 14
 
-    def test_file_output_qa_passes(self, monthly_schema, jan_sources, tmp_path):
-        """File output should also pass QA validation."""
-        mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map(jan_sources)
-        output = tmp_path / "report.pptx"
-        PPTXBuilder(monthly_schema).build_to_file(result.payload, output)
+    def test_file_output_qa_passes(self, jan_report_file, jan_pptx_bytes,
+                                   jan_qa_result):
+        """File output should also pass QA validation.
 
-        with open(output, "rb") as f:
-            pptx_bytes = f.read()
-        qa_result = QAValidator(monthly_schema).validate(pptx_bytes, result.payload)
-        structural = [i for i in qa_result.errors
-                      if i.category in ("slide_count", "dimensions")]
-        assert len(structural) == 0
+        The file holds the same slide XML as the in-memory build, so the
+        shared QA pass over that build covers it.
+        """
+        written = jan_report_file.read_bytes()
+        assert xml_part_crcs(written) == xml_part_crcs(jan_pptx_bytes)
+        assert _structural_errors(jan_qa_result) == []
 
 
 # ---------------------------------------------------------------------------
 # Schema compatibility: mapper keys vs schema keys
 # ---------------------------------------------------------------------------
 
+@_JAN_GROUP
 class TestMapperSchemaCompat:
     """Mapper output keys should align with schema expectations."""
 
-    def test_mapper_covers_all_slot_data_keys(self, monthly_schema, jan_sources):
+    def test_mapper_covers_all_slot_data_keys(self, monthly_slot_keys,
+                                              jan_mapped_result):
         """Mapper payload should contain data for most schema data_keys."""
-        mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map(jan_sources)
-
-        schema_keys = set()
-        for slide in monthly_schema.slides:
-            for slot in slide.slots:
-                if slot.data_key:
-                    schema_keys.add(slot.data_key)
-                if slot.variance_key:
-                    schema_keys.add(slot.variance_key)
-                if slot.row_data_key:
-                    schema_keys.add(slot.row_data_key)
-                if slot.categories_key:
-                    schema_keys.add(slot.categories_key)
-                for series in slot.series:
-                    schema_keys.add(series.data_key)
-
-        payload_keys = set(result.payload.keys())
+        schema_keys = monthly_slot_keys
         # Most schema keys should be present (manual slides may not have data)
-        covered = schema_keys & payload_keys
         total_data_keys = {k for k in schema_keys
-                          if not any(k.startswith(p) for p in ("upcoming.", "next_steps."))}
-        coverage = len(covered & total_data_keys) / len(total_data_keys) if total_data_keys else 1.0
+                           if not k.startswith(("upcoming.", "next_steps."))}
+        covered = total_data_keys & jan_mapped_result.payload.keys()
+        coverage = len(covered) / len(total_data_keys) if total_data_keys else 1.0
         assert coverage > 0.5
 
-    def test_payload_keys_are_valid_strings(self, monthly_schema, jan_sources):
-        mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map(jan_sources)
-        for key in result.payload:
+    def test_payload_keys_are_valid_strings(self, jan_mapped_result):
+        for key in jan_mapped_result.payload:
             assert isinstance(key, str)
             assert "." in key, f"Key {key} missing namespace separator"
 
@@ -768,24 +528,16 @@ class TestMapperSchemaCompat:
 class TestQBRBuilderQA:
     """QBR schema → PPTXBuilder → QAValidator (no mapper for QBR yet)."""
 
-    def test_qbr_empty_payload_29_slides(self, qbr_schema):
+    def test_qbr_empty_payload_29_slides(self, qbr_blank_prs):
         """QBR builder should produce 29 slides even with empty payload."""
-        pptx_bytes = PPTXBuilder(qbr_schema).build({})
-        prs = _bytes_to_prs(pptx_bytes)
-        assert len(prs.slides) == 29
+        assert len(qbr_blank_prs.slides) == 29
 
-    def test_qbr_dimensions_oversized(self, qbr_schema):
-        pptx_bytes = PPTXBuilder(qbr_schema).build({})
-        prs = _bytes_to_prs(pptx_bytes)
-        assert prs.slide_width == Inches(21.986)
-        assert prs.slide_height == Inches(12.368)
+    def test_qbr_dimensions_oversized(self, qbr_blank_prs):
+        assert qbr_blank_prs.slide_width == Inches(21.986)
+        assert qbr_blank_prs.slide_height == Inches(12.368)
 
-    def test_qbr_qa_structural(self, qbr_schema):
-        pptx_bytes = PPTXBuilder(qbr_schema).build({})
-        qa_result = QAValidator(qbr_schema).validate(pptx_bytes, {})
-        structural = [i for i in qa_result.errors
-                      if i.category in ("slide_count", "dimensions")]
-        assert len(structural) == 0
+    def test_qbr_qa_structural(self, qbr_blank_qa_result):
+        assert _structural_errors(qbr_blank_qa_result) == []
 
     def test_qbr_with_cover_payload(self, qbr_schema):
         """QBR with cover KPIs should render correctly."""
@@ -810,25 +562,18 @@ class TestQBRBuilderQA:
         assert len(prs.slides) == 29
 
         cover = prs.slides[0]
-        all_text = " ".join(
-            s.text_frame.text for s in cover.shapes if s.has_text_frame
-        )
-        assert "Q1 2026" in all_text
+        assert _slide_has_text(cover, "Q1 2026")
 
-    def test_qbr_divider_slides_have_backgrounds(self, qbr_schema):
+    def test_qbr_divider_slides_have_backgrounds(self, qbr_blank_qa_result):
         """QBR divider slides should have filled backgrounds."""
-        pptx_bytes = PPTXBuilder(qbr_schema).build({})
-        qa_result = QAValidator(qbr_schema).validate(pptx_bytes, {})
-        bg_errors = [i for i in qa_result.errors
-                     if i.category == "divider_background"]
-        assert len(bg_errors) == 0
+        assert "divider_background" not in qbr_blank_qa_result.errors_by_category
 
-    def test_qbr_file_output(self, qbr_schema, tmp_path):
+    def test_qbr_file_output(self, qbr_schema, qbr_blank_bytes, tmp_path):
         output = tmp_path / "No7_QBR_Q1_2026.pptx"
         PPTXBuilder(qbr_schema).build_to_file({}, output)
         assert output.exists()
-        prs = Presentation(str(output))
-        assert len(prs.slides) == 29
+        # Same slide XML as the in-memory 29-slide build; no re-parse needed
+        assert xml_part_crcs(output.read_bytes()) == xml_part_crcs(qbr_blank_bytes)
 
 
 # ---------------------------------------------------------------------------
@@ -850,106 +595,74 @@ class TestCrossSchema:
         assert monthly_schema.report_type == "monthly"
         assert qbr_schema.report_type == "qbr"
 
-    def test_both_build_without_errors(self, monthly_schema, qbr_schema):
+    def test_both_build_without_errors(self, monthly_blank_bytes, qbr_blank_bytes):
         """Both schemas should build successfully with empty payloads."""
-        m_bytes = PPTXBuilder(monthly_schema).build({})
-        q_bytes = PPTXBuilder(qbr_schema).build({})
-        assert len(m_bytes) > 0
-        assert len(q_bytes) > 0
-
-    def test_both_qa_pass_structural(self, monthly_schema, qbr_schema):
-        m_bytes = PPTXBuilder(monthly_schema).build({})
-        q_bytes = PPTXBuilder(qbr_schema).build({})
-
-        m_qa = QAValidator(monthly_schema).validate(m_bytes, {})
-        q_qa = QAValidator(qbr_schema).validate(q_bytes, {})
+        assert len(monthly_blank_bytes) > 0
+        assert len(qbr_blank_bytes) > 0
 
-        for qa_result in [m_qa, q_qa]:
-            structural = [i for i in qa_result.errors
-                          if i.category in ("slide_count", "dimensions")]
-            assert len(structural) == 0
+    def test_both_qa_pass_structural(self, monthly_blank_qa_result,
+                                     qbr_blank_qa_result):
+        for qa_result in [monthly_blank_qa_result, qbr_blank_qa_result]:
+            assert _structural_errors(qa_result) == []
 
 
 # ---------------------------------------------------------------------------
 # Slide content verification
 # ---------------------------------------------------------------------------
 
+@_JAN_GROUP
 class TestSlideContentVerification:
     """Deep verification of specific slide contents after full pipeline."""
 
-    def test_cover_slide_has_title(self, monthly_schema, jan_sources):
-        mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map(jan_sources)
-        pptx_bytes = PPTXBuilder(monthly_schema).build(result.payload)
-        prs = _bytes_to_prs(pptx_bytes)
-
-        cover = prs.slides[0]
-        all_text = " ".join(
-            s.text_frame.text for s in cover.shapes if s.has_text_frame
-        )
-        assert "No7 US" in all_text
-        assert "January 2026" in all_text
-
-    def test_exec_slide_has_table(self, monthly_schema, jan_sources):
-        mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map(jan_sources)
-        pptx_bytes = PPTXBuilder(monthly_schema).build(result.payload)
-        prs = _bytes_to_prs(pptx_bytes)
+    def test_cover_slide_has_title(self, jan_prs):
+        cover = jan_prs.slides[0]
+        assert _slide_has_text(cover, "No7 US")
+        assert _slide_has_text(cover, "January 2026")
 
-        exec_slide = prs.slides[3]
+    def test_exec_slide_has_table(self, jan_prs):
+        exec_slide = jan_prs.slides[3]
         tables = [s for s in exec_slide.shapes if s.has_table]
         assert len(tables) >= 1
         # Table should have header + data rows
         table = tables[0].table
         assert len(table.rows) >= 2  # At least header + 1 data row
 
-    def test_divider_slides_text(self, monthly_schema, jan_sources):
-        mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map(jan_sources)
-        pptx_bytes = PPTXBuilder(monthly_schema).build(result.payload)
-        prs = _bytes_to_prs(pptx_bytes)
-
+    def test_divider_slides_text(self, jan_prs):
         # Slide 2 = eComm divider
-        divider = prs.slides[2]
-        all_text = " ".join(
-            s.text_frame.text for s in divider.shapes if s.has_text_frame
-        )
-        assert "eComm" in all_text
-
-    def test_toc_slide_has_items(self, monthly_schema, jan_sources):
-        mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map(jan_sources)
-        pptx_bytes = PPTXBuilder(monthly_schema).build(result.payload)
-        prs = _bytes_to_prs(pptx_bytes)
+        divider = jan_prs.slides[2]
+        assert _slide_has_text(divider, "eComm")
 
-        toc = prs.slides[1]
-        all_text = " ".join(
-            s.text_frame.text for s in toc.shapes if s.has_text_frame
-        )
-        assert "eComm Performance" in all_text
+    def test_toc_slide_has_items(self, jan_prs):
+        toc = jan_prs.slides[1]
+        assert _slide_has_text(toc, "eComm Performance")
 
 
 # ---------------------------------------------------------------------------
 # Variance coloring in E2E context
 # ---------------------------------------------------------------------------
 
+@_JAN_GROUP
 class TestVarianceColoringE2E:
     """Verify positive/negative variance coloring through full pipeline."""
 
-    def test_variance_coloring_on_cover(self, monthly_schema):
+    def test_variance_coloring_on_cover(self, monthly_schema, jan_mapped_result,
+                                        jan_qa_result):
         """Cover KPIs with non-zero variances should have correct colors."""
-        sources = _all_sources(2026, 1)
-        mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map(sources)
-        pptx_bytes = PPTXBuilder(monthly_schema).build(result.payload)
-        qa_result = QAValidator(monthly_schema).validate(pptx_bytes, result.payload)
-
-        # Filter out zero-variance color errors — synthetic data produces
-        # identical TY/LY for some metrics (AOV, CVR, COS), causing 0.0%
+        # Skip zero-variance slots — synthetic data produces identical
+        # actuals and targets for some metrics (AOV, CVR, COS), causing 0.0%
         # variances where the builder uses green but QA expects neutral.
-        color_errors = [i for i in qa_result.errors
-                        if i.category == "variance_color"
-                        and "'0.0%'" not in i.message]
+        payload = jan_mapped_result.payload
+        # Slot names repeat across slides, so key on (slide_index, slot_name)
+        zero_variance_slots = frozenset(
+            (slide.index, slot.name)
+            for slide in monthly_schema.slides for slot in slide.slots
+            if slot.variance_key and payload.get(slot.variance_key) == 0.0
+        )
+        color_errors = [
+            i for i in jan_qa_result.errors
+            if i.category == "variance_color"
+            and (i.slide_index, i.slot_name) not in zero_variance_slots
+        ]
         assert len(color_errors) == 0
 
 
@@ -957,25 +670,16 @@ class TestVarianceColoringE2E:
 # QA report output in E2E context
 # ---------------------------------------------------------------------------
 
+@_JAN_GROUP
 class TestQAReportE2E:
     """Verify QA report formatting after full pipeline."""
 
-    def test_qa_report_is_string(self, monthly_schema, jan_sources):
-        mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map(jan_sources)
-        pptx_bytes = PPTXBuilder(monthly_schema).build(result.payload)
-        qa_result = QAValidator(monthly_schema).validate(pptx_bytes, result.payload)
-
-        report = qa_result.report()
+    def test_qa_report_is_string(self, jan_qa_result):
+        report = jan_qa_result.report()
         assert isinstance(report, str)
         assert len(report) > 0
         assert "QA" in report
 
-    def test_qa_summary_format(self, monthly_schema, jan_sources):
-        mapper = DataMapper(monthly_schema, month=1, year=2026)
-        result = mapper.map(jan_sources)
-        pptx_bytes = PPTXBuilder(monthly_schema).build(result.payload)
-        qa_result = QAValidator(monthly_schema).validate(pptx_bytes, result.payload)
-
-        summary = qa_result.summary()
+    def test_qa_summary_format(self, jan_qa_result):
+        summary = jan_qa_result.summary()
         assert "error" in summary.lower() or "PASS" in summary
@@ -24,7 +24,6 @@ from src.schema.models import (
     ChartSeries,
     ChartType,
     DataSlot,
-    DesignSystem,
     FontSpec,
     FormatRule,
     FormatType,
@@ -35,19 +34,16 @@ from src.schema.models import (
     TableColumn,
     TemplateSchema,
 )
-from src.schema.monthly_report import build_monthly_report_schema
 
 
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
-@pytest.fixture
-def design():
-    return DesignSystem()
+# ``design`` and ``full_schema`` come from conftest. The schemas here are
+# read-only once built, so they are session-scoped like those.
 
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def minimal_schema(design):
     """Single-slide schema for focused tests."""
     return TemplateSchema(
@@ -69,7 +65,7 @@ def minimal_schema(design):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def kpi_schema(design):
     """Schema with a single KPI slot."""
     return TemplateSchema(
@@ -102,7 +98,7 @@ def kpi_schema(design):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def table_schema(design):
     """Schema with a single table slot."""
     return TemplateSchema(
@@ -154,7 +150,7 @@ def table_schema(design):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def chart_schema(design):
     """Schema with a column chart slot."""
     return TemplateSchema(
@@ -197,7 +193,7 @@ def chart_schema(design):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def doughnut_schema(design):
     """Schema with a doughnut chart slot."""
     return TemplateSchema(
@@ -231,7 +227,7 @@ def doughnut_schema(design):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def divider_schema(design):
     """Schema with a section divider slide."""
     return TemplateSchema(
@@ -262,7 +258,7 @@ def divider_schema(design):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def text_schema(design):
     """Schema with text slots."""
     return TemplateSchema(
@@ -299,16 +295,28 @@ def text_schema(design):
     )
 
 
-@pytest.fixture
-def full_schema():
-    return build_monthly_report_schema()
-
-
 def _build(schema, payload):
     """Build PPTX bytes from schema+payload."""
     return PPTXBuilder(schema).build(payload)
 
 
+# Decks and QA passes read by several tests, built once per session
+
+@pytest.fixture(scope="session")
+def minimal_pptx_bytes(minimal_schema):
+    return _build(minimal_schema, {})
+
+
+@pytest.fixture(scope="session")
+def minimal_qa_result(minimal_schema, minimal_pptx_bytes):
+    return QAValidator(minimal_schema).validate(minimal_pptx_bytes, {})
+
+
+@pytest.fixture(scope="session")
+def full_empty_qa_result(full_schema):
+    return QAValidator(full_schema).validate(_build(full_schema, {}), {})
+
+
 # ---------------------------------------------------------------------------
 # Helper function tests
 # ---------------------------------------------------------------------------
@@ -399,6 +407,18 @@ class TestQAResult:
         assert result.error_count == 2
         assert result.warning_count == 1
 
+    def test_errors_by_category(self):
+        result = QAResult(issues=[
+            Issue("error", 0, "", "", "a", "err"),
+            Issue("warning", 1, "", "", "a", "warn"),
+            Issue("error", 2, "", "", "b", "err2"),
+            Issue("error", 3, "", "", "a", "err3"),
+        ])
+        grouped = result.errors_by_category
+        assert [i.message for i in grouped["a"]] == ["err", "err3"]
+        assert [i.message for i in grouped["b"]] == ["err2"]
+        assert "c" not in grouped
+
     def test_summary_pass(self):
         result = QAResult()
         assert "PASS" in result.summary()
@@ -423,11 +443,9 @@ class TestQAResult:
 # ---------------------------------------------------------------------------
 
 class TestSlideCount:
-    def test_correct_slide_count(self, minimal_schema):
-        pptx_bytes = _build(minimal_schema, {})
-        result = QAValidator(minimal_schema).validate(pptx_bytes, {})
+    def test_correct_slide_count(self, minimal_qa_result):
         slide_count_errors = [
-            i for i in result.issues if i.category == "slide_count"
+            i for i in minimal_qa_result.issues if i.category == "slide_count"
         ]
         assert len(slide_count_errors) == 0
 
@@ -460,11 +478,9 @@ class TestSlideCount:
         assert "Expected 2" in errors[0].message
         assert "got 1" in errors[0].message
 
-    def test_full_schema_slide_count(self, full_schema):
-        pptx_bytes = _build(full_schema, {})
-        result = QAValidator(full_schema).validate(pptx_bytes, {})
+    def test_full_schema_slide_count(self, full_empty_qa_result):
         slide_count_errors = [
-            i for i in result.errors if i.category == "slide_count"
+            i for i in full_empty_qa_result.errors if i.category == "slide_count"
         ]
         assert len(slide_count_errors) == 0
 
@@ -474,11 +490,9 @@ class TestSlideCount:
 # ---------------------------------------------------------------------------
 
 class TestDimensions:
-    def test_correct_dimensions(self, minimal_schema):
-        pptx_bytes = _build(minimal_schema, {})
-        result = QAValidator(minimal_schema).validate(pptx_bytes, {})
+    def test_correct_dimensions(self, minimal_qa_result):
         dim_errors = [
-            i for i in result.errors if i.category == "dimensions"
+            i for i in minimal_qa_result.errors if i.category == "dimensions"
         ]
         assert len(dim_errors) == 0
 
@@ -901,6 +915,32 @@ class TestDividerValidation:
         ]
         assert len(bg_errors) == 0
 
+    def test_validate_divider_backgrounds_only(self, divider_schema):
+        pptx_bytes = _build(divider_schema, {})
+        qa = QAValidator(divider_schema)
+        full = qa.validate(pptx_bytes, {})
+        focused = qa.validate_divider_backgrounds(pptx_bytes)
+        assert focused.issues == [
+            i for i in full.issues if i.category == "divider_background"
+        ]
+
+    def test_validate_divider_backgrounds_wrong_fill(self, divider_schema):
+        prs = Presentation(io.BytesIO(_build(divider_schema, {})))
+        fill = prs.slides[0].background.fill
+        fill.solid()
+        fill.fore_color.rgb = RGBColor(0xFF, 0x00, 0x00)
+        buf = io.BytesIO()
+        prs.save(buf)
+
+        qa = QAValidator(divider_schema)
+        focused = qa.validate_divider_backgrounds(buf.getvalue())
+        assert [i.category for i in focused.errors] == ["divider_background"]
+        assert "FF0000" in focused.errors[0].message
+        full = qa.validate(buf.getvalue(), {})
+        assert focused.issues == [
+            i for i in full.issues if i.category == "divider_background"
+        ]
+
     def test_divider_text_present(self, divider_schema):
         payload = {"divider.title": "eComm Performance"}
         pptx_bytes = _build(divider_schema, payload)
@@ -955,9 +995,9 @@ class TestTextValidation:
 # ---------------------------------------------------------------------------
 
 class TestConvenience:
-    def test_validate_presentation_function(self, minimal_schema):
-        pptx_bytes = _build(minimal_schema, {})
-        result = validate_presentation(minimal_schema, pptx_bytes, {})
+    def test_validate_presentation_function(self, minimal_schema,
+                                            minimal_pptx_bytes):
+        result = validate_presentation(minimal_schema, minimal_pptx_bytes, {})
         assert isinstance(result, QAResult)
         assert result.passed is True
 
@@ -990,229 +1030,218 @@ class TestValidatePayload:
 # Full 14-slide integration tests
 # ---------------------------------------------------------------------------
 
-class TestFullIntegration:
-    def _sample_payload(self):
-        """Representative payload covering all 14 slides."""
-        return {
-            "cover.report_title": "No7 US Monthly eComm Report",
-            "cover.report_period": "January 2026 Overview",
-            "cover.total_revenue": 1234567,
-            "cover.total_orders": 12345,
-            "cover.aov": 100.0,
-            "cover.new_customers": 4500,
-            "cover.cvr": 3.6,
-            "cover.cos": 12.5,
-            "cover.revenue_vs_target": 5.2,
-            "cover.orders_vs_target": 3.1,
-            "cover.aov_vs_target": -1.2,
-            "cover.nc_vs_target": 8.0,
-            "cover.cvr_vs_target": 0.5,
-            "cover.cos_vs_target": -0.3,
-            "toc.items": [
-                "eComm Performance Overview",
-                "Daily Performance",
-                "Promotion Performance",
-            ],
-            "divider.ecomm_title": "eComm Performance",
-            "divider.channels_title": "Channel Deep Dives",
-            "divider.outlook_title": "Outlook",
-            "exec.title": "Executive Summary",
-            "exec.performance_rows": [
-                {
-                    "channel": "Total",
-                    "revenue": 1234567,
-                    "revenue_vs_target": 5.2,
-                    "revenue_vs_ly": 12.3,
-                    "orders": 12345,
-                    "sessions": 345678,
-                    "cvr": 3.6,
-                    "aov": 100.0,
-                    "cos": 12.5,
-                    "new_customers": 4500,
-                },
-            ],
-            "exec.narrative": "Strong month.",
-            "daily.title": "Daily Performance",
-            "daily.dates": ["1/1", "1/2", "1/3"],
-            "daily.revenue_actual": [40000, 45000, 38000],
-            "daily.revenue_target": [42000, 42000, 42000],
-            "daily.revenue_ly": [35000, 38000, 32000],
-            "daily.campaign_rows": [
-                {"date": "1/1", "activity": "New Year Sale"},
-            ],
-            "daily.revenue_achieved_pct": 75.0,
-            "daily.revenue_remaining_pct": 25.0,
-            "promo.title": "Promotion Performance",
-            "promo.rows": [
-                {
-                    "promotion_name": "New Year Sale",
-                    "channel": "All",
-                    "redemptions": 5000,
-                    "redemptions_vs_ly": 12.5,
-                    "revenue": 250000,
-                    "revenue_vs_ly": 8.3,
-                    "discount_amount": 45000,
-                },
-            ],
-            "product.title": "Product Performance",
-            "product.rows": [
-                {
-                    "product_name": "No7 Serum",
-                    "units": 3500,
-                    "units_vs_ly": 15.2,
-                    "revenue": 175000,
-                    "revenue_vs_ly": 18.1,
-                    "aov": 50.0,
-                    "avg_selling_price": 50.0,
-                    "discount_pct": 5.0,
-                    "new_customers": 800,
-                },
-            ],
-            "crm.title": "CRM Performance",
-            "crm.emails_sent": 250000,
-            "crm.emails_sent_vs_ly": 5.0,
-            "crm.open_rate": 22.5,
-            "crm.open_rate_vs_ly": 1.2,
-            "crm.ctr": 3.8,
-            "crm.ctr_vs_ly": -0.5,
-            "crm.revenue": 180000,
-            "crm.revenue_vs_ly": 12.0,
-            "crm.cvr": 4.2,
-            "crm.cvr_vs_ly": 0.3,
-            "crm.aov": 95.0,
-            "crm.aov_vs_ly": -2.1,
-            "crm.detail_rows": [
-                {
-                    "campaign_type": "Manual",
-                    "emails_sent": 150000,
-                    "open_rate": 25.0,
-                    "ctr": 4.2,
-                    "sessions": 6300,
-                    "orders": 252,
-                    "cvr": 4.0,
-                    "revenue": 120000,
-                    "aov": 476.19,
-                    "revenue_vs_ly": 10.0,
-                },
-            ],
-            "affiliate.title": "Affiliate Performance",
-            "affiliate.revenue": 95000,
-            "affiliate.revenue_vs_ly": 7.5,
-            "affiliate.cos": 8.0,
-            "affiliate.cos_vs_ly": -1.0,
-            "affiliate.roas": 12.5,
-            "affiliate.roas_vs_ly": 1.2,
-            "affiliate.orders": 950,
-            "affiliate.orders_vs_ly": 5.0,
-            "affiliate.cvr": 2.8,
-            "affiliate.cvr_vs_ly": 0.2,
-            "affiliate.publisher_rows": [
-                {
-                    "publisher_name": "Publisher A",
-                    "revenue": 30000,
-                    "revenue_vs_ly": 10.0,
-                    "commission": 2400,
-                    "cos": 8.0,
-                    "orders": 300,
-                    "cvr": 3.0,
-                    "sessions": 10000,
-                    "aov": 100.0,
-                },
-            ],
-            "seo.title": "SEO Performance",
-            "seo.revenue": 120000,
-            "seo.revenue_vs_ly": 6.0,
-            "seo.sessions": 80000,
-            "seo.sessions_vs_ly": 4.5,
-            "seo.cvr": 3.0,
-            "seo.cvr_vs_ly": 0.1,
-            "seo.orders": 2400,
-            "seo.orders_vs_ly": 6.5,
-            "seo.aov": 50.0,
-            "seo.aov_vs_ly": -0.5,
-            "seo.narrative": "Organic traffic grew steadily.",
-            "upcoming.title": "Upcoming Promotions",
-            "upcoming.rows": [],
-            "next_steps.title": "Next Steps",
-            "next_steps.items": "Review Feb targets",
-        }
+def _full_sample_payload():
+    """Representative payload covering all 14 slides."""
+    return {
+        "cover.report_title": "No7 US Monthly eComm Report",
+        "cover.report_period": "January 2026 Overview",
+        "cover.total_revenue": 1234567,
+        "cover.total_orders": 12345,
+        "cover.aov": 100.0,
+        "cover.new_customers": 4500,
+        "cover.cvr": 3.6,
+        "cover.cos": 12.5,
+        "cover.revenue_vs_target": 5.2,
+        "cover.orders_vs_target": 3.1,
+        "cover.aov_vs_target": -1.2,
+        "cover.nc_vs_target": 8.0,
+        "cover.cvr_vs_target": 0.5,
+        "cover.cos_vs_target": -0.3,
+        "toc.items": [
+            "eComm Performance Overview",
+            "Daily Performance",
+            "Promotion Performance",
+        ],
+        "divider.ecomm_title": "eComm Performance",
+        "divider.channels_title": "Channel Deep Dives",
+        "divider.outlook_title": "Outlook",
+        "exec.title": "Executive Summary",
+        "exec.performance_rows": [
+            {
+                "channel": "Total",
+                "revenue": 1234567,
+                "revenue_vs_target": 5.2,
+                "revenue_vs_ly": 12.3,
+                "orders": 12345,
+                "sessions": 345678,
+                "cvr": 3.6,
+                "aov": 100.0,
+                "cos": 12.5,
+                "new_customers": 4500,
+            },
+        ],
+        "exec.narrative": "Strong month.",
+        "daily.title": "Daily Performance",
+        "daily.dates": ["1/1", "1/2", "1/3"],
+        "daily.revenue_actual": [40000, 45000, 38000],
+        "daily.revenue_target": [42000, 42000, 42000],
+        "daily.revenue_ly": [35000, 38000, 32000],
+        "daily.campaign_rows": [
+            {"date": "1/1", "activity": "New Year Sale"},
+        ],
+        "daily.revenue_achieved_pct": 75.0,
+        "daily.revenue_remaining_pct": 25.0,
+        "promo.title": "Promotion Performance",
+        "promo.rows": [
+            {
+                "promotion_name": "New Year Sale",
+                "channel": "All",
+                "redemptions": 5000,
+                "redemptions_vs_ly": 12.5,
+                "revenue": 250000,
+                "revenue_vs_ly": 8.3,
+                "discount_amount": 45000,
+            },
+        ],
+        "product.title": "Product Performance",
+        "product.rows": [
+            {
+                "product_name": "No7 Serum",
+                "units": 3500,
+                "units_vs_ly": 15.2,
+                "revenue": 175000,
+                "revenue_vs_ly": 18.1,
+                "aov": 50.0,
+                "avg_selling_price": 50.0,
+                "discount_pct": 5.0,
+                "new_customers": 800,
+            },
+        ],
+        "crm.title": "CRM Performance",
+        "crm.emails_sent": 250000,
+        "crm.emails_sent_vs_ly": 5.0,
+        "crm.open_rate": 22.5,
+        "crm.open_rate_vs_ly": 1.2,
+        "crm.ctr": 3.8,
+        "crm.ctr_vs_ly": -0.5,
+        "crm.revenue": 180000,
+        "crm.revenue_vs_ly": 12.0,
+        "crm.cvr": 4.2,
+        "crm.cvr_vs_ly": 0.3,
+        "crm.aov": 95.0,
+        "crm.aov_vs_ly": -2.1,
+        "crm.detail_rows": [
+            {
+                "campaign_type": "Manual",
+                "emails_sent": 150000,
+                "open_rate": 25.0,
+                "ctr": 4.2,
+                "sessions": 6300,
+                "orders": 252,
+                "cvr": 4.0,
+                "revenue": 120000,
+                "aov": 476.19,
+                "revenue_vs_ly": 10.0,
+            },
+        ],
+        "affiliate.title": "Affiliate Performance",
+        "affiliate.revenue": 95000,
+        "affiliate.revenue_vs_ly": 7.5,
+        "affiliate.cos": 8.0,
+        "affiliate.cos_vs_ly": -1.0,
+        "affiliate.roas": 12.5,
+        "affiliate.roas_vs_ly": 1.2,
+        "affiliate.orders": 950,
+        "affiliate.orders_vs_ly": 5.0,
+        "affiliate.cvr": 2.8,
+        "affiliate.cvr_vs_ly": 0.2,
+        "affiliate.publisher_rows": [
+            {
+                "publisher_name": "Publisher A",
+                "revenue": 30000,
+                "revenue_vs_ly": 10.0,
+                "commission": 2400,
+                "cos": 8.0,
+                "orders": 300,
+                "cvr": 3.0,
+                "sessions": 10000,
+                "aov": 100.0,
+            },
+        ],
+        "seo.title": "SEO Performance",
+        "seo.revenue": 120000,
+        "seo.revenue_vs_ly": 6.0,
+        "seo.sessions": 80000,
+        "seo.sessions_vs_ly": 4.5,
+        "seo.cvr": 3.0,
+        "seo.cvr_vs_ly": 0.1,
+        "seo.orders": 2400,
+        "seo.orders_vs_ly": 6.5,
+        "seo.aov": 50.0,
+        "seo.aov_vs_ly": -0.5,
+        "seo.narrative": "Organic traffic grew steadily.",
+        "upcoming.title": "Upcoming Promotions",
+        "upcoming.rows": [],
+        "next_steps.title": "Next Steps",
+        "next_steps.items": "Review Feb targets",
+    }
+
+
+@pytest.fixture(scope="session")
+def full_sample_pptx_bytes(full_schema):
+    return _build(full_schema, _full_sample_payload())
+
+
+@pytest.fixture(scope="session")
+def full_sample_qa_result(full_schema, full_sample_pptx_bytes):
+    return QAValidator(full_schema).validate(
+        full_sample_pptx_bytes, _full_sample_payload(),
+    )
 
-    def test_full_14_slide_passes(self, full_schema):
-        payload = self._sample_payload()
-        pptx_bytes = _build(full_schema, payload)
-        result = QAValidator(full_schema).validate(pptx_bytes, payload)
+
+class TestFullIntegration:
+    def test_full_14_slide_passes(self, full_sample_qa_result):
         # No slide-count or dimension errors
         structural = [
-            i for i in result.errors
+            i for i in full_sample_qa_result.errors
             if i.category in ("slide_count", "dimensions")
         ]
         assert len(structural) == 0
 
-    def test_full_14_slide_empty_payload(self, full_schema):
-        pptx_bytes = _build(full_schema, {})
-        result = QAValidator(full_schema).validate(pptx_bytes, {})
+    def test_full_14_slide_empty_payload(self, full_empty_qa_result):
         # Should have no errors (only warnings for missing data)
         structural = [
-            i for i in result.errors
+            i for i in full_empty_qa_result.errors
             if i.category in ("slide_count", "dimensions")
         ]
         assert len(structural) == 0
 
-    def test_full_14_slide_count(self, full_schema):
-        payload = self._sample_payload()
-        pptx_bytes = _build(full_schema, payload)
-        result = QAValidator(full_schema).validate(pptx_bytes, payload)
+    def test_full_14_slide_count(self, full_sample_qa_result):
         count_errors = [
-            i for i in result.errors if i.category == "slide_count"
+            i for i in full_sample_qa_result.errors if i.category == "slide_count"
         ]
         assert len(count_errors) == 0
 
-    def test_full_divider_backgrounds(self, full_schema):
-        payload = self._sample_payload()
-        pptx_bytes = _build(full_schema, payload)
-        result = QAValidator(full_schema).validate(pptx_bytes, payload)
-        bg_errors = [
-            i for i in result.errors if i.category == "divider_background"
-        ]
-        assert len(bg_errors) == 0
+    def test_full_divider_backgrounds(self, full_schema, full_sample_pptx_bytes):
+        qa = QAValidator(full_schema)
+        result = qa.validate_divider_backgrounds(full_sample_pptx_bytes)
+        assert result.passed
 
-    def test_full_exec_table(self, full_schema):
-        payload = self._sample_payload()
-        pptx_bytes = _build(full_schema, payload)
-        result = QAValidator(full_schema).validate(pptx_bytes, payload)
+    def test_full_exec_table(self, full_sample_qa_result):
         table_errors = [
-            i for i in result.errors
+            i for i in full_sample_qa_result.errors
             if i.category in ("table_row_count", "table_column_count",
                               "table_header", "table_missing")
             and "exec" in i.slide_name
         ]
         assert len(table_errors) == 0
 
-    def test_full_cover_kpis(self, full_schema):
-        payload = self._sample_payload()
-        pptx_bytes = _build(full_schema, payload)
-        result = QAValidator(full_schema).validate(pptx_bytes, payload)
+    def test_full_cover_kpis(self, full_sample_qa_result):
         kpi_errors = [
-            i for i in result.errors
+            i for i in full_sample_qa_result.errors
             if i.category == "kpi_value_missing"
             and "cover" in i.slide_name
         ]
         assert len(kpi_errors) == 0
 
-    def test_full_chart_validation(self, full_schema):
-        payload = self._sample_payload()
-        pptx_bytes = _build(full_schema, payload)
-        result = QAValidator(full_schema).validate(pptx_bytes, payload)
+    def test_full_chart_validation(self, full_sample_qa_result):
         chart_type_errors = [
-            i for i in result.errors if i.category == "chart_type"
+            i for i in full_sample_qa_result.errors if i.category == "chart_type"
         ]
         assert len(chart_type_errors) == 0
 
-    def test_report_output(self, full_schema):
-        payload = self._sample_payload()
-        pptx_bytes = _build(full_schema, payload)
-        result = QAValidator(full_schema).validate(pptx_bytes, payload)
-        report = result.report()
+    def test_report_output(self, full_sample_qa_result):
+        report = full_sample_qa_result.report()
         assert "QA" in report
         assert "error" in report.lower() or "warning" in report.lower() or "PASS" in report
 